@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import asyncio
+import logging
 import uuid
 from functools import wraps
 from typing import Callable, Optional
@@ -8,13 +9,14 @@ from typing import Callable, Optional
 from authlib.integrations.starlette_client import OAuth
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
-from jose import JWTError, jwt
+from jwt import PyJWTError
 from pydantic import ValidationError
 from starlette.requests import Request
 
 from app.core.config import settings
 from app.core.database import get_db
 from app.core.rate_limiter import CooldownManager, RateLimiter, RateLimitStrategy
+from app.core.security import decode_request_token, parse_user_id
 from app.core.types import TokenData
 from app.core.valkey import valkey_client
 from app.domains import UserRepository
@@ -25,6 +27,8 @@ oauth2_scheme = OAuth2PasswordBearer(tokenUrl=f"{settings.API_VERSION}/auth/logi
 
 oauth2_scheme_optional = OAuth2PasswordBearer(tokenUrl=f"{settings.API_VERSION}/auth/login", auto_error=False)
 
+logger = logging.getLogger(__name__)
+
 oauth = OAuth()
 
 oauth.register(
@@ -50,18 +54,30 @@ def get_oauth() -> OAuth:
     return oauth
 
 
-async def get_current_user(token: str = Depends(oauth2_scheme)) -> TokenData:
+async def preload_oauth_metadata() -> None:
+    """
+    Fetch OpenID discovery documents at startup so the first OAuth login skips that HTTPS round trip.
+    Authlib keeps the loaded metadata on the client; providers without a metadata URL are no-ops.
+    """
+    for provider in OAuthProvider:
+        try:
+            await oauth.create_client(provider.value).load_server_metadata()
+        except Exception as e:
+            logger.warning(f"Could not preload OAuth metadata for {provider.value}: {e}")
+
+
+async def get_current_user(request: Request, token: str = Depends(oauth2_scheme)) -> TokenData:
     """Validate JWT token and return current user"""
 
     try:
-        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
-        user_id: uuid.UUID = uuid.UUID(payload.get("sub"))
+        payload = decode_request_token(request, token)
+        user_id: uuid.UUID = parse_user_id(payload.get("sub"))
         username: str = payload.get("username")
         email: str = payload.get("email")
         role: Role = payload.get("role")
 
         token_data = TokenData(id=user_id, username=username, email=email, role=role)
-    except (JWTError, ValidationError, ValueError):
+    except (PyJWTError, ValidationError, ValueError):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Could not validate credentials",
@@ -74,7 +90,9 @@ async def get_current_user(token: str = Depends(oauth2_scheme)) -> TokenData:
     return token_data
 
 
-def get_optional_current_user(token: str | None = Depends(oauth2_scheme_optional)) -> TokenData | None:
+async def get_optional_current_user(
+    request: Request, token: str | None = Depends(oauth2_scheme_optional)
+) -> TokenData | None:
     """
     Validate JWT token if present, but return None if no token
     or if token is invalid. Allows anonymous access.
@@ -83,13 +101,13 @@ def get_optional_current_user(token: str | None = Depends(oauth2_scheme_optional
         return None
 
     try:
-        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
-        user_id: uuid.UUID = uuid.UUID(payload.get("sub"))
+        payload = decode_request_token(request, token)
+        user_id: uuid.UUID = parse_user_id(payload.get("sub"))
         username: str = payload.get("username")
         email: str = payload.get("email")
         role: Role = payload.get("role")
         token_data = TokenData(id=user_id, username=username, email=email, role=role)
-    except (JWTError, ValidationError, ValueError):
+    except (PyJWTError, ValidationError, ValueError):
         return None
     return token_data
 
@@ -103,8 +121,10 @@ def require_role(min_role: Role):
         HTTPException: If user does not have required roles
     """
 
-    def role_checker(user: TokenData = Depends(get_current_user)) -> TokenData:
-        if ROLE_HIERARCHY[user.role] > ROLE_HIERARCHY[min_role]:
+    min_rank = ROLE_HIERARCHY[min_role]
+
+    async def role_checker(user: TokenData = Depends(get_current_user)) -> TokenData:
+        if ROLE_HIERARCHY[user.role] > min_rank:
             raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Requires elevated access")
         return user
 
@@ -136,6 +156,17 @@ async def require_verified_email(
     return current_user
 
 
+def _as_async(func: Callable) -> Callable:
+    """Resolve once, at decoration time, how to await a handler; sync handlers run in a worker thread."""
+    if asyncio.iscoroutinefunction(func):
+        return func
+
+    async def call(*args, **kwargs):
+        return await asyncio.to_thread(func, *args, **kwargs)
+
+    return call
+
+
 def rate_limit(
     max_requests: int = 10,
     window_seconds: int = 60,
@@ -155,6 +186,8 @@ def rate_limit(
     """
 
     def decorator(func: Callable):
+        call = _as_async(func)
+
         @wraps(func)
         async def wrapper(*args, **kwargs):
             if not settings.TESTING:
@@ -189,10 +222,7 @@ def rate_limit(
                         },
                     )
 
-            result = func(*args, **kwargs)
-            if asyncio.iscoroutine(result):
-                return await result
-            return result
+            return await call(*args, **kwargs)
 
         return wrapper
 
@@ -210,6 +240,8 @@ def cooldown(action: str, cooldown_seconds: int):
     """
 
     def decorator(func: Callable):
+        call = _as_async(func)
+
         @wraps(func)
         async def wrapper(*args, **kwargs):
             if not settings.TESTING:
@@ -235,10 +267,7 @@ def cooldown(action: str, cooldown_seconds: int):
                         },
                         headers={"Retry-After": str(seconds_remaining)},
                     )
-            result = func(*args, **kwargs)
-            if asyncio.iscoroutine(result):
-                return await result
-            return result
+            return await call(*args, **kwargs)
 
         return wrapper
 
@@ -1,3 +1,4 @@
 from .decorators import handle_api_errors
+from .etag import etag_response
 
-__all__ = ["handle_api_errors"]
+__all__ = ["handle_api_errors", "etag_response"]
@@ -0,0 +1,34 @@
+import hashlib
+
+from fastapi import Request, Response, status
+from pydantic import BaseModel
+
+CACHE_CONTROL_REVALIDATE = "private, max-age=0, must-revalidate"
+
+
+def _if_none_match(request: Request, etag: str) -> bool:
+    """Weak comparison (RFC 9110 §13.1.2) of the ETag against each entry of If-None-Match."""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    opaque = etag.removeprefix("W/")
+    for candidate in header.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == opaque:
+            return True
+    return False
+
+
+def etag_response(request: Request, model: BaseModel) -> Response:
+    """
+    Serialize a schema with a weak ETag derived from its body.
+    Returns 304 Not Modified without a body when the client's If-None-Match matches.
+    """
+    body = model.model_dump_json().encode("utf-8")
+    etag = f'W/"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+    headers = {"ETag": etag, "Cache-Control": CACHE_CONTROL_REVALIDATE}
+
+    if _if_none_match(request, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    return Response(content=body, media_type="application/json", headers=headers)
@@ -1,6 +1,7 @@
+import asyncio
 import uuid
 
-from fastapi import Depends
+from fastapi import Depends, Request
 from sqlalchemy.orm import Session
 from starlette import status
 from starlette.exceptions import HTTPException
@@ -13,6 +14,23 @@ from app.literals.users import Role
 from app.models import ChannelMember
 
 
+async def get_membership(
+    request: Request, db: Session, channel_id: uuid.UUID, user_id: uuid.UUID
+) -> ChannelMember | None:
+    """Fetch the user's channel membership once per request.
+
+    Several permission dependencies may guard the same endpoint, so the
+    result is memoized on ``request.state`` to avoid repeating the query.
+    """
+    memberships = getattr(request.state, "channel_memberships", None)
+    if memberships is None:
+        memberships = request.state.channel_memberships = {}
+    key = (channel_id, user_id)
+    if key not in memberships:
+        memberships[key] = await asyncio.to_thread(db.get, ChannelMember, (channel_id, user_id))
+    return memberships[key]
+
+
 def get_channel_permission(min_role: ChannelRole = ChannelRole.USER):
     """Factory to create channel permission checker.
     Args:
@@ -20,17 +38,15 @@ def get_channel_permission(min_role: ChannelRole = ChannelRole.USER):
     Raises:
         HTTPException: If user does not have required channel roles
     """
+    min_rank = CHANNEL_ROLE_HIERARCHY[min_role]
 
-    def permission_checker(
+    async def permission_checker(
         channel_id: uuid.UUID,
+        request: Request,
         user: TokenData = Depends(get_current_user),
         db: Session = Depends(get_db),
     ) -> type[ChannelMember] | None:
-        membership = (
-            db.query(ChannelMember)
-            .filter(ChannelMember.channel_id == channel_id, ChannelMember.user_id == user.id)
-            .one_or_none()
-        )
+        membership = await get_membership(request, db, channel_id, user.id)
         if user.role == Role.ADMIN:
             return membership
 
@@ -44,7 +60,7 @@ def get_channel_permission(min_role: ChannelRole = ChannelRole.USER):
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="You are banned from this channel",
             )
-        if CHANNEL_ROLE_HIERARCHY[membership.role] > CHANNEL_ROLE_HIERARCHY[min_role]:
+        if CHANNEL_ROLE_HIERARCHY[membership.role] > min_rank:
             raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Requires elevated access")
 
         return membership
@@ -52,17 +68,14 @@ def get_channel_permission(min_role: ChannelRole = ChannelRole.USER):
     return permission_checker
 
 
-def is_channel_member(
+async def is_channel_member(
     channel_id: uuid.UUID,
+    request: Request,
     user: TokenData = Depends(get_current_user),
     db: Session = Depends(get_db),
 ) -> type[ChannelMember] | None:
     """Check if user is a channel member"""
-    membership = (
-        db.query(ChannelMember)
-        .filter(ChannelMember.channel_id == channel_id, ChannelMember.user_id == user.id)
-        .one_or_none()
-    )
+    membership = await get_membership(request, db, channel_id, user.id)
     if user.role == Role.ADMIN:
         return membership
 
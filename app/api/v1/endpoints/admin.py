@@ -3,6 +3,7 @@ from starlette import status
 from starlette.exceptions import HTTPException
 
 from app.api.dependencies import cooldown, require_role
+from app.core.config import settings
 from app.core.types import TokenData
 from app.literals.users import Role
 from app.seeds.seed import seed_database
@@ -11,7 +12,7 @@ router = APIRouter()
 
 
 @router.post("/reset-db", status_code=status.HTTP_200_OK)
-@cooldown(action="reset_db", cooldown_seconds=30)
+@cooldown(action="reset_db", cooldown_seconds=settings.NUKE_COOLDOWN_SECONDS)
 def reset_db(
     current_user: TokenData = Depends(require_role(Role.ADMIN)),
 ):
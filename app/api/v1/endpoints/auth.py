@@ -1,3 +1,5 @@
+import asyncio
+
 from authlib.integrations.starlette_client import OAuth
 from fastapi import APIRouter, Body, Depends
 from fastapi.security import OAuth2PasswordRequestForm
@@ -88,7 +90,9 @@ async def signup(
     client_ip = get_client_ip(request)
     user_agent = request.headers.get("User-Agent", "Unknown")
 
-    user_service.register(
+    # register() hashes the password; keep bcrypt off the event loop
+    await asyncio.to_thread(
+        user_service.register,
         data=data,
         ip_address=client_ip,
         user_agent=user_agent
@@ -1,11 +1,13 @@
 import uuid
 from typing import List
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
 from sqlalchemy.orm import Session
 
 from app.api.dependencies import get_current_user, require_role
-from app.api.utils import handle_api_errors
+from app.api.utils import etag_response, handle_api_errors
 from app.core.database import get_db
 from app.core.types import TokenData
 from app.domains.user.user_service import UserService
@@ -38,7 +40,15 @@ def _filter_admin_only_fields(user_in: UserUpdate) -> UserUpdate:
     return UserUpdate(**data)
 
 
-@router.post("/", response_model=UserRead, status_code=status.HTTP_201_CREATED)
+def _write_response(model: BaseModel, status_code: int = status.HTTP_200_OK) -> JSONResponse:
+    """
+    Serialize a service-validated schema directly.
+    Write endpoints skip response_model so FastAPI does not validate the same object twice.
+    """
+    return JSONResponse(content=model.model_dump(mode="json"), status_code=status_code)
+
+
+@router.post("/", status_code=status.HTTP_201_CREATED, responses={status.HTTP_201_CREATED: {"model": UserRead}})
 @handle_api_errors()
 def create_user(
     user_in: UserCreate,
@@ -48,32 +58,36 @@ def create_user(
     """
     Create a new user. Requires ADMIN role.
     """
-    return service.create_user(user_in)
+    return _write_response(service.create_user(user_in), status.HTTP_201_CREATED)
 
 
 @router.get("/me", response_model=UserDetail)
 @handle_api_errors()
 def get_current_user_profile(
+    request: Request,
     service: UserService = Depends(get_user_service),
     current_user: TokenData = Depends(get_current_user),
 ):
     """
     Get current authenticated user's profile.
+    Supports conditional requests via ETag / If-None-Match.
     """
-    return service.get_user_detail(current_user.id)
+    return etag_response(request, service.get_user_detail(current_user.id))
 
 
 @router.get("/{user_id}", response_model=UserDetail)
 @handle_api_errors()
 def get_user(
     user_id: uuid.UUID,
+    request: Request,
     service: UserService = Depends(get_user_service),
     _: TokenData = Depends(require_role(Role.ADMIN)),
 ):
     """
     Retrieve a user by ID. Requires ADMIN role.
+    Supports conditional requests via ETag / If-None-Match.
     """
-    return service.get_user_detail(user_id)
+    return etag_response(request, service.get_user_detail(user_id))
 
 
 @router.get("/", response_model=List[UserRead])
@@ -90,7 +104,7 @@ def list_users(
     return service.list_users(skip=skip, limit=limit, search=search)
 
 
-@router.patch("/me", response_model=UserRead)
+@router.patch("/me", responses={status.HTTP_200_OK: {"model": UserRead}})
 @handle_api_errors()
 def update_current_user(
     user_in: UserUpdate,
@@ -102,10 +116,10 @@ def update_current_user(
     """
     if current_user.role != Role.ADMIN:
         user_in = _filter_admin_only_fields(user_in)
-    return service.update_user(current_user.id, user_in)
+    return _write_response(service.update_user(current_user.id, user_in))
 
 
-@router.patch("/{user_id}", response_model=UserRead)
+@router.patch("/{user_id}", responses={status.HTTP_200_OK: {"model": UserRead}})
 @handle_api_errors()
 def update_user(
     user_id: uuid.UUID,
@@ -123,10 +137,10 @@ def update_user(
         )
     if current_user.role != Role.ADMIN:
         user_in = _filter_admin_only_fields(user_in)
-    return service.update_user(user_id, user_in)
+    return _write_response(service.update_user(user_id, user_in))
 
 
-@router.put("/me/password", response_model=UserRead)
+@router.put("/me/password", responses={status.HTTP_200_OK: {"model": UserRead}})
 @handle_api_errors()
 def change_current_user_password(
     password_change: UserPasswordChange,
@@ -136,10 +150,10 @@ def change_current_user_password(
     """
     Change current authenticated user's password.
     """
-    return service.change_password(current_user.id, password_change, verify_current=True)
+    return _write_response(service.change_password(current_user.id, password_change, verify_current=True))
 
 
-@router.put("/{user_id}/password", response_model=UserRead)
+@router.put("/{user_id}/password", responses={status.HTTP_200_OK: {"model": UserRead}})
 @handle_api_errors()
 def change_user_password(
     user_id: uuid.UUID,
@@ -151,7 +165,7 @@ def change_user_password(
     Change a user's password. Requires ADMIN role.
     Admin password changes don't verify current password.
     """
-    return service.change_password(user_id, password_change, verify_current=False)
+    return _write_response(service.change_password(user_id, password_change, verify_current=False))
 
 
 @router.delete("/{user_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -9,6 +9,7 @@ from app.core.database import get_db
 from app.core.types import TokenData
 from app.domains.user.like_service import UserLikeService
 from app.literals.like_status import LikeTargetType
+from app.literals.users import Role
 from app.schemas.user_like import UserLikeRead
 
 router = APIRouter()
@@ -68,7 +69,7 @@ def unlike_target(
         target_id=target_id,
         target_type=target_type,
         current_user_id=current_user.id,
-        is_admin=current_user.role.lower() == "admin",
+        is_admin=current_user.role == Role.ADMIN,
     )
 
     return {"detail": "Like deactivated successfully."}
@@ -94,7 +95,7 @@ def get_my_likes(
         user_id=current_user.id,
         target_type=target_type,
         current_user_id=current_user.id,
-        is_admin=current_user.role.lower() == "admin",
+        is_admin=current_user.role == Role.ADMIN,
         only_active=only_active,
     )
 
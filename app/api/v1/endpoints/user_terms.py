@@ -1,6 +1,7 @@
 from typing import List
 
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Response, status
+from pydantic import TypeAdapter
 from sqlalchemy.orm import Session
 
 from app.api.dependencies import get_current_user
@@ -62,31 +63,19 @@ def get_terms_status(
     """
     Checks if the user accepted the latest Terms version.
     """
-    latest = acceptance_service.terms_service.get_latest_terms()
-    if not latest:
-        return {
-            "latest_terms_id": None,
-            "latest_version": None,
-            "accepted_latest": False,
-            "user_last_accepted_terms_id": None,
-        }
+    return acceptance_service.get_terms_status(current_user.id)
 
-    user_last = acceptance_service.get_last_user_acceptance(current_user.id)
 
-    return {
-        "latest_terms_id": latest.id,
-        "latest_version": latest.version,
-        "accepted_latest": user_last is not None and user_last.terms_id == latest.id,
-        "user_last_accepted_terms_id": user_last.terms_id if user_last else None,
-    }
+# Built once at import: serializes the list in a single pydantic-core pass
+ACCEPTANCE_LIST_ADAPTER = TypeAdapter(List[UserTermsAcceptanceList])
 
 
 # GET /user/list — list all terms accepted
 @router.get(
     "/user/list",
-    response_model=List[UserTermsAcceptanceList],
     status_code=status.HTTP_200_OK,
     summary="List all Terms acceptances of current user",
+    responses={status.HTTP_200_OK: {"model": List[UserTermsAcceptanceList]}},
 )
 def list_user_acceptances(
     service: UserTermsAcceptanceService = Depends(get_user_terms_acceptance_service),
@@ -94,5 +83,8 @@ def list_user_acceptances(
 ):
     """
     Returns all Terms versions accepted by the logged-in user.
+    The service already builds validated schemas, so they are dumped straight to JSON
+    instead of being re-validated against a response_model.
     """
-    return service.list_user_acceptances(current_user.id)
+    acceptances = service.list_user_acceptances(current_user.id)
+    return Response(content=ACCEPTANCE_LIST_ADAPTER.dump_json(acceptances), media_type="application/json")
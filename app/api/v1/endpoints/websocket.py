@@ -1,76 +1,135 @@
 import asyncio
-import json
 import logging
 import uuid
 
+import orjson
 from fastapi import APIRouter, Depends, Query, WebSocket, WebSocketDisconnect
 from sqlalchemy.orm import Session
 from starlette.websockets import WebSocketState
 from websockets.frames import CloseCode
 
 from app.core import get_db
-from app.core.valkey import valkey_client
+from app.core.security import parse_user_id
 from app.domains.auth.auth_service import verify_token
 from app.domains.websocket.websocket_connection_service import WebSocketConnectionService
 from app.domains.websocket.websocket_manager import ws_manager
+from app.literals.websocket import EventTopic
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
+# Limits for clients that opt into batched frames; keep the added latency and frame size bounded
+WS_BATCH_WINDOW_SECONDS = 0.002
+WS_BATCH_MAX_MESSAGES = 32
+WS_BATCH_MAX_BYTES = 64 * 1024
 
-async def redis_listener(websocket: WebSocket, pubsub):
+# Client messages queued per connection; the receive loop waits once this many are pending
+WS_MAX_PENDING_MESSAGES = 8
+
+
+async def collect_batch(queue: asyncio.Queue, first: str) -> str:
     """
-    Background task: Listens for Redis messages and forwards them to the WebSocket.
+    Coalesce events that arrive within a short window into a single JSON array frame.
     """
-    try:
-        async for message in pubsub.listen():
-            if message["type"] == "message":
-                try:
-                    payload = message["data"]
+    payloads = [first]
+    size = len(first)
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + WS_BATCH_WINDOW_SECONDS
+
+    while len(payloads) < WS_BATCH_MAX_MESSAGES and size < WS_BATCH_MAX_BYTES:
+        if queue.empty():
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                payload = await asyncio.wait_for(queue.get(), timeout)
+            except asyncio.TimeoutError:
+                break
+        else:
+            payload = queue.get_nowait()
+        payloads.append(payload)
+        size += len(payload)
 
-                    if isinstance(payload, bytes):
-                        payload = payload.decode("utf-8")
+    return "[" + ",".join(payloads) + "]"
 
-                    data = json.loads(payload)
 
-                    if websocket.client_state == WebSocketState.CONNECTED:
-                        await websocket.send_json(data)
-                except Exception as e:
-                    logger.error(f"Error forwarding Redis message to WS: {e}")
+async def queue_listener(websocket: WebSocket, queue: asyncio.Queue, batch: bool = False):
+    """
+    Background task: Forwards events dispatched by the WebSocket manager to the WebSocket.
+    Events arrive as pre-serialized JSON text and are sent as text frames unchanged,
+    or as one JSON array per frame when the client asked for batching.
+    """
+    try:
+        while True:
+            payload = await queue.get()
+            if batch:
+                payload = await collect_batch(queue, payload)
+            try:
+                if websocket.client_state == WebSocketState.CONNECTED:
+                    await websocket.send_text(payload)
+            except Exception as e:
+                logger.error(f"Error forwarding Redis message to WS: {e}")
     except asyncio.CancelledError:
         pass
     except Exception as e:
-        logger.error(f"Redis listener error: {e}")
+        logger.error(f"Queue listener error: {e}")
+
+
+async def message_worker(
+    service: WebSocketConnectionService,
+    db: Session,
+    inbox: asyncio.Queue,
+    user_id: uuid.UUID,
+):
+    """
+    Background task: handles client messages one at a time, in the order they arrived.
+    The handlers share the connection's Session, so they must never run concurrently.
+    """
+    while True:
+        data = await inbox.get()
+        try:
+            await service.handle_client_message(data, user_id)
+        except Exception as e:
+            logger.error(f"Error handling client message: {e}")
+        finally:
+            # Hand the pooled connection back while the socket idles
+            db.close()
 
 
 @router.websocket("/ws")
-async def websocket_endpoint(websocket: WebSocket, token: str = Query(...), db: Session = Depends(get_db)):
+async def websocket_endpoint(
+    websocket: WebSocket, token: str = Query(...), batch: bool = Query(False), db: Session = Depends(get_db)
+):
     connection_id = str(uuid.uuid4())
     user_id = None
-    pubsub = None
     listener_task = None
+    worker_task = None
+    inbox: asyncio.Queue = asyncio.Queue(maxsize=WS_MAX_PENDING_MESSAGES)
 
     try:
         payload = await verify_token(token)
-        user_id = uuid.UUID(payload.get("sub"))
-
-        await ws_manager.connect(websocket, user_id, connection_id)
+        user_id = parse_user_id(payload.get("sub"))
 
         ws_connection_service = WebSocketConnectionService(db)
 
-        channel_topics = ws_connection_service.get_user_channel_subscriptions(user_id)
+        try:
+            channel_topics = await ws_connection_service.get_cached_channel_subscriptions(user_id)
+        finally:
+            # The socket may stay open for hours; hand the pooled connection back between uses
+            db.close()
 
-        topics_to_subscribe = [f"user:{user_id}", "global"] + (channel_topics or [])
+        topics_to_subscribe = [f"user:{user_id}", *(topic.value for topic in EventTopic)] + (channel_topics or [])
 
-        pubsub = valkey_client.client.pubsub()
-        await pubsub.subscribe(*topics_to_subscribe)
+        # Subscribe before accepting so events published right after the handshake are queued, not lost
+        queue = await ws_manager.subscribe(connection_id, topics_to_subscribe)
 
-        listener_task = asyncio.create_task(redis_listener(websocket, pubsub))
+        await ws_manager.connect(websocket, user_id, connection_id)
 
-        while True:
-            client_data = await websocket.receive_json()
+        listener_task = asyncio.create_task(queue_listener(websocket, queue, batch))
+        worker_task = asyncio.create_task(message_worker(ws_connection_service, db, inbox, user_id))
 
-            await ws_connection_service.handle_client_message(client_data, user_id)
+        while True:
+            await inbox.put(orjson.loads(await websocket.receive_text()))
 
     except WebSocketDisconnect:
         logger.info(f"WebSocket disconnected for user {user_id}")
@@ -82,16 +141,13 @@ async def websocket_endpoint(websocket: WebSocket, token: str = Query(...), db:
         elif websocket.client_state == WebSocketState.CONNECTED:
             await websocket.close(code=CloseCode.INTERNAL_ERROR)
     finally:
-        if listener_task:
-            listener_task.cancel()
-            try:
-                await listener_task
-            except asyncio.CancelledError:
-                pass
-
-        if pubsub:
-            await pubsub.unsubscribe()
-            await pubsub.close()
+        for task in (worker_task, listener_task):
+            if task:
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
 
         if user_id:
             await ws_manager.disconnect(user_id, connection_id)
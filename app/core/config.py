@@ -1,3 +1,4 @@
+from functools import cached_property, lru_cache
 from pathlib import Path
 
 from pydantic import computed_field
@@ -16,9 +17,19 @@ class Settings(BaseSettings):
     POSTGRES_DB: str = "unihub"
     POSTGRES_HOST: str = "localhost"
     POSTGRES_PORT: str = "5432"
+    DB_QUERY_CACHE_SIZE: int = 1200
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: int = 30
+    DB_POOL_RECYCLE: int = 3600
     DEBUG: bool = False
     SECRET_KEY: str = "secret"
     ALGORITHM: str = "HS256"
+    JWT_DECODE_CACHE_SIZE: int = 4096
+    JWT_DECODE_CACHE_TTL_SECONDS: int = 60
+    PASSWORD_HASH_TIME_COST: int = 2
+    PASSWORD_HASH_MEMORY_KIB: int = 19456
+    PASSWORD_HASH_PARALLELISM: int = 1
     ENVIRONMENT: str = "dev"
     PROD_URL: str = "https://computer-engineering-udl.github.io/UniHub-Front"
     TEMPORARY_DB: bool = False
@@ -33,10 +44,13 @@ class Settings(BaseSettings):
     VALKEY_HOST: str = "localhost"
     VALKEY_PASSWORD: str = "supersecret"
     VALKEY_TTL: int = 3600
+    VALKEY_HEALTH_CHECK_INTERVAL: int = 30
     USE_FAKE_VALKEY: bool = False
 
     NUKE_COOLDOWN_SECONDS: int = 30
 
+    TERMS_CACHE_TTL_SECONDS: int = 300
+
     MAX_FILE_SIZE: int = 10 * 1024 * 1024
     ALLOWED_FILE_TYPES: list[str] = [
         "image/jpeg",
@@ -82,7 +96,7 @@ class Settings(BaseSettings):
     )
 
     @computed_field
-    @property
+    @cached_property
     def DATABASE_URL(self) -> str:
         return (
             f"postgresql://{self.POSTGRES_USER}:"
@@ -93,14 +107,20 @@ class Settings(BaseSettings):
         )
 
     @computed_field
-    @property
+    @cached_property
     def VALKEY_URL(self) -> str:
         return f"redis://:{self.VALKEY_PASSWORD}@{self.VALKEY_HOST}:{self.VALKEY_PORT_NUMBER}"
 
     @computed_field
-    @property
+    @cached_property
     def FRONTEND_URL(self) -> str:
-        return "http://localhost:3200" if self.ENVIRONMENT == "dev" else settings.PROD_URL
+        return "http://localhost:3200" if self.ENVIRONMENT == "dev" else self.PROD_URL
+
+
+@lru_cache
+def get_settings() -> Settings:
+    """Return the process-wide Settings; the .env file is parsed only once."""
+    return Settings()
 
 
-settings = Settings()
+settings = get_settings()
@@ -1,9 +1,10 @@
 import atexit
 import os
 import tempfile
+from contextlib import contextmanager
 
 from sqlalchemy import create_engine
-from sqlalchemy.orm import declarative_base, sessionmaker
+from sqlalchemy.orm import Session, declarative_base, sessionmaker
 
 from app.core.config import settings
 
@@ -11,14 +12,21 @@ db_fd, db_path = None, None
 if settings.ENVIRONMENT == "dev":
     db_fd, db_path = tempfile.mkstemp(suffix=".db")
     print("Created database at {}".format(db_path))
-    engine = create_engine(f"sqlite:///{db_path}", pool_pre_ping=True)
+    engine = create_engine(
+        f"sqlite:///{db_path}",
+        pool_pre_ping=True,
+        query_cache_size=settings.DB_QUERY_CACHE_SIZE,
+    )
 else:
     engine = create_engine(
         settings.DATABASE_URL,
         pool_pre_ping=True,
         echo=settings.DEBUG,
-        pool_size=4,
-        max_overflow=6,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+        pool_recycle=settings.DB_POOL_RECYCLE,
+        query_cache_size=settings.DB_QUERY_CACHE_SIZE,
     )
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
@@ -27,6 +35,7 @@ Base = declarative_base()
 
 
 def get_db():
+    """Yield one session per request; it must not be shared across requests or concurrent tasks."""
     db = SessionLocal()
     try:
         yield db
@@ -34,6 +43,17 @@ def get_db():
         db.close()
 
 
+@contextmanager
+def unit_of_work(db: Session):
+    """Commit the session once the block succeeds, roll it back on any exception."""
+    try:
+        yield db
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+
+
 def cleanup_dev_db():
     """Clean up dev database on shutdown."""
     if settings.ENVIRONMENT == "dev" and db_path:
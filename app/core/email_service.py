@@ -1,18 +1,43 @@
 from __future__ import annotations
 
+import asyncio
 import logging
 import os
-import smtplib
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
 from typing import Optional
 
+import aiosmtplib
 from jinja2 import Environment, FileSystemLoader
 
 from app.core.config import settings
 
 logger = logging.getLogger(__name__)
 
+VERIFICATION_TEXT = """
+Welcome to UniRoom, {username}!
+
+Please verify your email address by visiting:
+{verification_link}
+
+This link expires in {expire_hours} hours.
+
+If you didn't create an account, you can safely ignore this email.
+"""
+
+PASSWORD_RESET_TEXT = """
+Password Reset Request
+
+Hi {username},
+
+We received a request to reset your password. Visit this link to set a new password:
+{reset_link}
+
+This link expires in {expire_hours} hour(s).
+
+If you didn't request this, you can safely ignore this email. Your password won't be changed.
+"""
+
 
 class EmailService:
     """
@@ -21,11 +46,29 @@ class EmailService:
 
     def __init__(self):
         self._smtp_configured = bool(settings.SMTP_HOST and settings.SMTP_USER)
+        self._smtp: Optional[aiosmtplib.SMTP] = None
+        self._smtp_lock = asyncio.Lock()
 
         template_dir = os.path.join(os.path.dirname(__file__), "templates")
-        self.env = Environment(loader=FileSystemLoader(template_dir), autoescape=True)
-
-    def _send_email(
+        self.env = Environment(loader=FileSystemLoader(template_dir), autoescape=True, auto_reload=False)
+        self._verification_template = self.env.get_template("verification_email.html")
+        self._password_reset_template = self.env.get_template("password_reset.html")
+
+    async def _get_smtp(self) -> aiosmtplib.SMTP:
+        """Return the shared SMTP connection, (re)connecting with STARTTLS and login when needed."""
+        if self._smtp is None:
+            self._smtp = aiosmtplib.SMTP(
+                hostname=settings.SMTP_HOST,
+                port=settings.SMTP_PORT,
+                username=settings.SMTP_USER,
+                password=settings.SMTP_PASSWORD,
+                start_tls=True,
+            )
+        if not self._smtp.is_connected:
+            await self._smtp.connect()
+        return self._smtp
+
+    async def _send_email(
         self,
         to_email: str,
         subject: str,
@@ -47,10 +90,15 @@ class EmailService:
                 msg.attach(MIMEText(text_content, "plain"))
             msg.attach(MIMEText(html_content, "html"))
 
-            with smtplib.SMTP(settings.SMTP_HOST, settings.SMTP_PORT) as server:
-                server.starttls()
-                server.login(settings.SMTP_USER, settings.SMTP_PASSWORD)
-                server.send_message(msg)
+            async with self._smtp_lock:
+                smtp = await self._get_smtp()
+                try:
+                    await smtp.send_message(msg)
+                except aiosmtplib.SMTPServerDisconnected:
+                    # The server dropped the idle connection; reconnect once and retry
+                    smtp.close()
+                    smtp = await self._get_smtp()
+                    await smtp.send_message(msg)
 
             logger.info(f"Email sent successfully to {to_email}")
             return True
@@ -59,56 +107,42 @@ class EmailService:
             logger.error(f"Failed to send email to {to_email}: {e}")
             return False
 
-    def send_verification_email(self, to_email: str, token: str, username: str) -> bool:
+    async def send_verification_email(self, to_email: str, token: str, username: str) -> bool:
         """Send email verification link."""
         verification_link = f"{settings.FRONTEND_URL}/verify?token={token}"
         subject = "Verify your UniRoom email address"
 
-        template = self.env.get_template("verification_email.html")
-        html_content = template.render(
+        html_content = self._verification_template.render(
             username=username,
             verification_link=verification_link,
             expire_hours=settings.VERIFICATION_TOKEN_EXPIRE_HOURS,
         )
 
-        text_content = f"""
-        Welcome to UniRoom, {username}!
-
-        Please verify your email address by visiting:
-        {verification_link}
-
-        This link expires in {settings.VERIFICATION_TOKEN_EXPIRE_HOURS} hours.
-
-        If you didn't create an account, you can safely ignore this email.
-        """
+        text_content = VERIFICATION_TEXT.format(
+            username=username,
+            verification_link=verification_link,
+            expire_hours=settings.VERIFICATION_TOKEN_EXPIRE_HOURS,
+        )
 
-        return self._send_email(to_email, subject, html_content, text_content)
+        return await self._send_email(to_email, subject, html_content, text_content)
 
-    def send_password_reset_email(self, to_email: str, token: str, username: str) -> bool:
+    async def send_password_reset_email(self, to_email: str, token: str, username: str) -> bool:
         """Send password reset link."""
 
         reset_link = f"{settings.FRONTEND_URL}/reset-password?token={token}"
         subject = "Reset your UniRoom password"
 
-        template = self.env.get_template("password_reset.html")
-        html_content = template.render(
+        html_content = self._password_reset_template.render(
             username=username, reset_link=reset_link, expire_hours=settings.PASSWORD_RESET_TOKEN_EXPIRE_HOURS
         )
 
-        text_content = f"""
-        Password Reset Request
-
-        Hi {username},
-
-        We received a request to reset your password. Visit this link to set a new password:
-        {reset_link}
-
-        This link expires in {settings.PASSWORD_RESET_TOKEN_EXPIRE_HOURS} hour(s).
-
-        If you didn't request this, you can safely ignore this email. Your password won't be changed.
-        """
+        text_content = PASSWORD_RESET_TEXT.format(
+            username=username,
+            reset_link=reset_link,
+            expire_hours=settings.PASSWORD_RESET_TOKEN_EXPIRE_HOURS,
+        )
 
-        return self._send_email(to_email, subject, html_content, text_content)
+        return await self._send_email(to_email, subject, html_content, text_content)
 
 
 email_service = EmailService()
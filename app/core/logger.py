@@ -1,10 +1,40 @@
 import datetime
-import json
 import logging
 from contextvars import ContextVar
 
+import orjson
+
 request_id_var: ContextVar[str] = ContextVar("request_id", default="")
 
+# LogRecord attributes that are not copied into the JSON output as extras
+STANDARD_ATTRIBUTES = frozenset(
+    {
+        "args",
+        "asctime",
+        "created",
+        "exc_info",
+        "exc_text",
+        "filename",
+        "funcName",
+        "levelname",
+        "levelno",
+        "lineno",
+        "message",
+        "module",
+        "msecs",
+        "msg",
+        "name",
+        "pathname",
+        "process",
+        "processName",
+        "relativeCreated",
+        "stack_info",
+        "thread",
+        "threadName",
+        "request_id",
+    }
+)
+
 
 class RequestIDFilter(logging.Filter):
     def filter(self, record):
@@ -23,7 +53,12 @@ class JSONFormatter(logging.Formatter):
 
     def format(self, record):
         log_obj = {
-            "timestamp": self.formatTime(record, self.datefmt),
+            # orjson encodes datetimes natively, in the same ISO format as formatTime
+            "timestamp": (
+                self.formatTime(record, self.datefmt)
+                if self.datefmt
+                else datetime.datetime.fromtimestamp(record.created)
+            ),
             "level": record.levelname,
             "message": record.getMessage(),
             "module": record.module,
@@ -31,40 +66,14 @@ class JSONFormatter(logging.Formatter):
             "request_id": getattr(record, "request_id", ""),
         }
 
-        standard_attributes = (
-            "args",
-            "asctime",
-            "created",
-            "exc_info",
-            "exc_text",
-            "filename",
-            "funcName",
-            "levelname",
-            "levelno",
-            "lineno",
-            "message",
-            "module",
-            "msecs",
-            "msg",
-            "name",
-            "pathname",
-            "process",
-            "processName",
-            "relativeCreated",
-            "stack_info",
-            "thread",
-            "threadName",
-            "request_id",
-        )
-
         for key, value in record.__dict__.items():
-            if key not in standard_attributes:
+            if key not in STANDARD_ATTRIBUTES:
                 log_obj[key] = value
 
         if record.exc_info:
             log_obj["exception"] = self.formatException(record.exc_info)
 
-        return json.dumps(log_obj)
+        return orjson.dumps(log_obj).decode()
 
 
 def setup_logger(name: str = __name__, level: int = logging.INFO):
@@ -1,58 +1,97 @@
-import asyncio
-import ipaddress
+import re
+import socket
 import time
-from typing import Optional
+from typing import Iterable, Optional
 from uuid import uuid4
 
 from fastapi import Request, status
 from fastapi.responses import JSONResponse
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from .logger import logger, request_id_var
 from .rate_limiter import RateLimiter, RateLimitStrategy
 from .security import get_payload
 
 
+def is_valid_ip(ip: str) -> bool:
+    """Check that ip is a literal IPv4 or IPv6 address."""
+    try:
+        socket.inet_pton(socket.AF_INET6 if ":" in ip else socket.AF_INET, ip)
+    except (OSError, ValueError):
+        return False
+    return True
+
+
 def get_client_ip(request: Request) -> str:
     """Extract the real client IP from proxy headers or fallback to direct connection."""
-    forwarded_for = request.headers.get("X-Forwarded-For")
+    headers = request.headers
+    forwarded_for = headers.get("X-Forwarded-For")
     if forwarded_for:
-        ip = forwarded_for.split(",")[0].strip()
-        try:
-            ipaddress.ip_address(ip)
+        ip = forwarded_for.partition(",")[0].strip()
+        if is_valid_ip(ip):
             return ip
-        except ValueError:
-            pass
-
-    real_ip = request.headers.get("X-Real-IP")
-    if real_ip:
-        try:
-            ipaddress.ip_address(real_ip)
-            return real_ip
-        except ValueError:
-            pass
 
-    cf_connecting_ip = request.headers.get("CF-Connecting-IP")
-    if cf_connecting_ip:
-        try:
-            ipaddress.ip_address(cf_connecting_ip)
-            return cf_connecting_ip
-        except ValueError:
-            pass
+    for header in ("X-Real-IP", "CF-Connecting-IP"):
+        ip = headers.get(header)
+        if ip and is_valid_ip(ip):
+            return ip
 
-    if request.client:
-        try:
-            ipaddress.ip_address(request.client.host)
-            return request.client.host
-        except ValueError:
-            pass
+    if request.client and is_valid_ip(request.client.host):
+        return request.client.host
 
     return "127.0.0.1"
 
 
-class AutoLoggingMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next):
-        request_id = request.headers.get("X-Request-ID", str(uuid4()))
+def compile_prefixes(prefixes: Iterable[str]) -> Optional[re.Pattern]:
+    """Compile path prefixes into one anchored alternation, one capture group per prefix in order."""
+    prefixes = list(prefixes)
+    if not prefixes:
+        return None
+    return re.compile("|".join(f"({re.escape(prefix)})" for prefix in prefixes))
+
+
+def send_with_headers(send: Send, headers: dict[str, str]) -> Send:
+    """Wrap an ASGI send callable to add headers to the response start message."""
+
+    async def wrapped(message: Message):
+        if message["type"] == "http.response.start":
+            response_headers = MutableHeaders(scope=message)
+            for name, value in headers.items():
+                response_headers[name] = value
+        await send(message)
+
+    return wrapped
+
+
+def rate_limit_subject(request: Request) -> str:
+    """
+    Identify who a request counts against: the token subject, or the client host for anonymous calls.
+    The result is kept on request.state so stacked rate-limit middlewares read the Authorization header once.
+    """
+    subject = getattr(request.state, "rate_limit_subject", None)
+    if subject is None:
+        user_id = None
+        scheme, _, token = request.headers.get("Authorization", "").partition(" ")
+        if scheme == "Bearer" and token:
+            payload = get_payload(token, request)
+            user_id = payload.get("sub")
+        host = request.client.host if request.client else "0.0.0.0"
+        subject = request.state.rate_limit_subject = user_id or host
+    return subject
+
+
+class AutoLoggingMiddleware:
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request = Request(scope)
+        request_id = request.headers.get("X-Request-ID") or uuid4().hex
         request_id_var.set(request_id)
         client_ip = get_client_ip(request)
 
@@ -66,31 +105,32 @@ class AutoLoggingMiddleware(BaseHTTPMiddleware):
             },
         )
 
-        start_time = time.time()
+        start_time = time.perf_counter()
+        status_code = None
+
+        async def send_with_request_id(message: Message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                MutableHeaders(scope=message)["X-Request-ID"] = request_id
+            await send(message)
 
         try:
-            result = call_next(request)
-            if asyncio.iscoroutine(result):
-                response = await result
-            else:
-                response = result
-            duration = time.time() - start_time
+            await self.app(scope, receive, send_with_request_id)
+            duration = time.perf_counter() - start_time
 
             logger.info(
-                f"{request.method} {request.url.path} - {response.status_code}",
+                f"{request.method} {request.url.path} - {status_code}",
                 extra={
                     "method": request.method,
                     "path": request.url.path,
-                    "status_code": response.status_code,
+                    "status_code": status_code,
                     "duration_ms": round(duration * 1000, 2),
                 },
             )
 
-            response.headers["X-Request-ID"] = request_id
-            return response
-
         except Exception as e:
-            duration = time.time() - start_time
+            duration = time.perf_counter() - start_time
             logger.error(
                 f"{request.method} {request.url.path} - ERROR",
                 extra={
@@ -120,38 +160,32 @@ async def global_exception_handler(request: Request, exc: Exception):
     )
 
 
-class RateLimitMiddleware(BaseHTTPMiddleware):
+class RateLimitMiddleware:
     """
     Global rate limiting middleware
     Adds rate limit headers to all responses
     """
 
     def __init__(
-        self, app, max_requests: int = 100, window_seconds: int = 60, exclude_paths: Optional[list[str]] = None
+        self,
+        app: ASGIApp,
+        max_requests: int = 100,
+        window_seconds: int = 60,
+        exclude_paths: Optional[list[str]] = None,
     ):
-        super().__init__(app)
+        self.app = app
         self.max_requests = max_requests
         self.window_seconds = window_seconds
         self.exclude_paths = exclude_paths or ["/docs", "/redoc", "/openapi.json", "/health"]
+        self._exclude_re = compile_prefixes(self.exclude_paths)
 
-    async def dispatch(self, request: Request, call_next):
-        if any(request.url.path.startswith(path) for path in self.exclude_paths):
-            result = call_next(request)
-            if asyncio.iscoroutine(result):
-                return await result
-            return result
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http" or self._exclude_re.match(scope["path"]):
+            await self.app(scope, receive, send)
+            return
 
-        user_id = None
-        auth_header = request.headers.get("Authorization")
-        if auth_header and auth_header.startswith("Bearer "):
-            token = auth_header.split(" ")[1]
-            payload = get_payload(token)
-            user_id = payload.get("sub")
-
-        if user_id:
-            key = f"global:{user_id}"
-        else:
-            key = f"global:{request.client.host}"
+        request = Request(scope)
+        key = "global:" + rate_limit_subject(request)
 
         is_allowed, remaining, retry_after = await RateLimiter.check_rate_limit(
             key=key,
@@ -161,7 +195,7 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
         )
 
         if not is_allowed:
-            return JSONResponse(
+            response = JSONResponse(
                 status_code=429,
                 content={"detail": "Global rate limit exceeded", "retry_after": retry_after},
                 headers={
@@ -171,70 +205,56 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
                     "X-RateLimit-Reset": str(retry_after),
                 },
             )
+            await response(scope, receive, send)
+            return
 
-        result = call_next(request)
-        if asyncio.iscoroutine(result):
-            response = await result
-        else:
-            response = result
-
-        response.headers["X-RateLimit-Limit"] = str(self.max_requests)
-        response.headers["X-RateLimit-Remaining"] = str(remaining)
-        response.headers["X-RateLimit-Window"] = str(self.window_seconds)
+        headers = {
+            "X-RateLimit-Limit": str(self.max_requests),
+            "X-RateLimit-Remaining": str(remaining),
+            "X-RateLimit-Window": str(self.window_seconds),
+        }
+        await self.app(scope, receive, send_with_headers(send, headers))
 
-        return response
 
-
-class EndpointRateLimitMiddleware(BaseHTTPMiddleware):
+class EndpointRateLimitMiddleware:
     """
     Per-endpoint rate limiting middleware
     Configure different limits for different endpoints
     """
 
-    def __init__(self, app, endpoint_limits: dict[str, tuple[int, int]]):
+    def __init__(self, app: ASGIApp, endpoint_limits: dict[str, tuple[int, int]]):
         """
         Args:
             app: FastAPI application
             endpoint_limits: Dict of endpoint patterns to (max_requests, window_seconds)
         """
-        super().__init__(app)
+        self.app = app
         self.endpoint_limits = endpoint_limits
+        self._pattern_re = compile_prefixes(endpoint_limits)
+        self._limits = tuple(
+            (f"endpoint:{pattern.replace('/', '_')}:", max_requests, window_seconds)
+            for pattern, (max_requests, window_seconds) in endpoint_limits.items()
+        )
 
-    async def dispatch(self, request: Request, call_next):
-        max_requests = None
-        window_seconds = None
-
-        for pattern, (limit, window) in self.endpoint_limits.items():
-            if request.url.path.startswith(pattern):
-                max_requests = limit
-                window_seconds = window
-                break
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        match = None
+        if scope["type"] == "http" and self._pattern_re:
+            match = self._pattern_re.match(scope["path"])
 
-        if max_requests is None:
-            result = call_next(request)
-            if asyncio.iscoroutine(result):
-                return await result
-            return result
+        if match is None:
+            await self.app(scope, receive, send)
+            return
 
-        user_id = None
-        auth_header = request.headers.get("Authorization")
-        if auth_header and auth_header.startswith("Bearer "):
-            token = auth_header.split(" ")[1]
-            payload = get_payload(token)
-            user_id = payload.get("sub")
-
-        endpoint_key = request.url.path.replace("/", "_")
-        if user_id:
-            key = f"endpoint:{endpoint_key}:{user_id}"
-        else:
-            key = f"endpoint:{endpoint_key}:{request.client.host}"
+        request = Request(scope)
+        key_prefix, max_requests, window_seconds = self._limits[match.lastindex - 1]
+        key = key_prefix + rate_limit_subject(request)
 
         is_allowed, remaining, retry_after = await RateLimiter.check_rate_limit(
             key=key, max_requests=max_requests, window_seconds=window_seconds, strategy=RateLimitStrategy.SLIDING_WINDOW
         )
 
         if not is_allowed:
-            return JSONResponse(
+            response = JSONResponse(
                 status_code=429,
                 content={"detail": f"Rate limit exceeded for {request.url.path}", "retry_after": retry_after},
                 headers={
@@ -243,14 +263,11 @@ class EndpointRateLimitMiddleware(BaseHTTPMiddleware):
                     "X-RateLimit-Remaining": "0",
                 },
             )
-
-        result = call_next(request)
-        if asyncio.iscoroutine(result):
-            response = await result
-        else:
-            response = result
-
-        response.headers["X-RateLimit-Limit"] = str(max_requests)
-        response.headers["X-RateLimit-Remaining"] = str(remaining)
-
-        return response
+            await response(scope, receive, send)
+            return
+
+        headers = {
+            "X-RateLimit-Limit": str(max_requests),
+            "X-RateLimit-Remaining": str(remaining),
+        }
+        await self.app(scope, receive, send_with_headers(send, headers))
@@ -1,10 +1,95 @@
+import time
 import uuid
-from datetime import datetime
 from enum import Enum
-from typing import Tuple
+from typing import Optional, Tuple
+
+from redis.commands.core import AsyncScript
 
 from app.core.valkey import valkey_client
 
+# Atomic sliding window: trim, count, record allowed requests and compute retry_after in one round trip.
+# ARGV[4] is a unique member so requests landing on the same timestamp are all counted.
+SLIDING_WINDOW_SCRIPT = """
+local key = KEYS[1]
+local max_requests = tonumber(ARGV[1])
+local window = tonumber(ARGV[2])
+local now = tonumber(ARGV[3])
+
+redis.call('ZREMRANGEBYSCORE', key, 0, now - window)
+-- Keep at most max_requests entries, e.g. after the limit for this key was lowered
+redis.call('ZREMRANGEBYRANK', key, 0, -max_requests - 1)
+local count = redis.call('ZCARD', key)
+
+if count < max_requests then
+    redis.call('ZADD', key, now, ARGV[4])
+    redis.call('EXPIRE', key, window)
+    return {1, max_requests - count - 1, 0}
+end
+
+local retry_after = window
+local oldest = redis.call('ZRANGE', key, 0, 0, 'WITHSCORES')
+if oldest[2] then
+    retry_after = math.floor(tonumber(oldest[2]) + window - now)
+end
+return {0, 0, retry_after}
+"""
+
+# Start the cooldown if it is not running, otherwise report its remaining TTL
+COOLDOWN_SCRIPT = """
+if redis.call('SET', KEYS[1], '1', 'NX', 'EX', ARGV[1]) then
+    return 0
+end
+return redis.call('TTL', KEYS[1])
+"""
+
+# Atomic token bucket: refill from the server clock, take a token and persist the bucket in one round trip
+TOKEN_BUCKET_SCRIPT = """
+local key = KEYS[1]
+local capacity = tonumber(ARGV[1])
+local refill_rate = tonumber(ARGV[2])
+local time = redis.call('TIME')
+local now = tonumber(time[1]) + tonumber(time[2]) / 1000000
+
+local bucket = redis.call('HMGET', key, 'tokens', 'last_refill')
+local tokens = capacity
+local last_refill = now
+if bucket[1] then
+    tokens = tonumber(bucket[1])
+    last_refill = tonumber(bucket[2]) or now
+end
+
+tokens = math.min(capacity, tokens + (now - last_refill) * refill_rate)
+
+if tokens >= 1 then
+    tokens = tokens - 1
+    redis.call('HSET', key, 'tokens', tostring(tokens), 'last_refill', tostring(now))
+    redis.call('EXPIRE', key, 3600)
+    return {1, math.floor(tokens), 0}
+end
+return {0, 0, math.floor((1 - tokens) / refill_rate) + 1}
+"""
+
+_scripts: dict[str, AsyncScript] = {}
+
+
+def _script(source: str) -> AsyncScript:
+    """
+    Return the registered script for source. Calls go through EVALSHA and
+    fall back to loading the script on NOSCRIPT, so the SHA1 is computed once per process.
+    """
+    script: Optional[AsyncScript] = _scripts.get(source)
+    if script is None:
+        script = valkey_client.client.register_script(source)
+        _scripts[source] = script
+    return script
+
+
+async def load_scripts() -> None:
+    """Load the Lua scripts into Valkey at startup so the first check does not pay a NOSCRIPT retry."""
+    client = valkey_client.client
+    for source in (SLIDING_WINDOW_SCRIPT, TOKEN_BUCKET_SCRIPT, COOLDOWN_SCRIPT):
+        await client.script_load(_script(source).script)
+
 
 class RateLimitStrategy(str, Enum):
     """Different rate limiting strategies"""
@@ -14,6 +99,13 @@ class RateLimitStrategy(str, Enum):
     TOKEN_BUCKET = "token_bucket"
 
 
+RATE_LIMIT_KEY_PREFIXES = {
+    RateLimitStrategy.FIXED_WINDOW: "rate_limit:fixed:",
+    RateLimitStrategy.SLIDING_WINDOW: "rate_limit:sliding:",
+    RateLimitStrategy.TOKEN_BUCKET: "rate_limit:bucket:",
+}
+
+
 class RateLimitExceeded(Exception):
     """Exception raised when rate limit is exceeded"""
 
@@ -56,7 +148,7 @@ class RateLimiter:
         Fixed window rate limiting
         Simple but can allow bursts at window boundaries
         """
-        redis_key = f"rate_limit:fixed:{key}"
+        redis_key = RATE_LIMIT_KEY_PREFIXES[RateLimitStrategy.FIXED_WINDOW] + key
         client = valkey_client.client
 
         current = await client.incr(redis_key)
@@ -78,39 +170,14 @@ class RateLimiter:
         Sliding window rate limiting using sorted sets
         More accurate than fixed window
         """
-        redis_key = f"rate_limit:sliding:{key}"
-        client = valkey_client.client
-
-        now = datetime.utcnow().timestamp()
-        window_start = now - window_seconds
-
-        pipe = client.pipeline()
-
-        pipe.zremrangebyscore(redis_key, 0, window_start)
-
-        pipe.zcard(redis_key)
-
-        pipe.zadd(redis_key, {str(now): now})
-
-        pipe.expire(redis_key, window_seconds)
-
-        results = await pipe.execute()
-        current_count = results[1]
-
-        is_allowed = current_count < max_requests
-        remaining = max(0, max_requests - current_count - 1)
+        redis_key = RATE_LIMIT_KEY_PREFIXES[RateLimitStrategy.SLIDING_WINDOW] + key
+        now = time.time()
 
-        if not is_allowed:
-            oldest_scores = await client.zrange(redis_key, 0, 0, withscores=True)
-            if oldest_scores:
-                oldest_timestamp = oldest_scores[0][1]
-                retry_after = int(oldest_timestamp + window_seconds - now)
-            else:
-                retry_after = window_seconds
-        else:
-            retry_after = 0
+        is_allowed, remaining, retry_after = await _script(SLIDING_WINDOW_SCRIPT)(
+            keys=[redis_key], args=[max_requests, window_seconds, now, uuid.uuid4().hex], client=valkey_client.client
+        )
 
-        return is_allowed, remaining, retry_after
+        return bool(is_allowed), remaining, retry_after
 
     @staticmethod
     async def _token_bucket(key: str, capacity: int, refill_rate: int) -> Tuple[bool, int, int]:
@@ -118,61 +185,35 @@ class RateLimiter:
         Token bucket algorithm
         Allows smooth rate limiting with burst capability
         """
-        redis_key = f"rate_limit:bucket:{key}"
-        client = valkey_client.client
-
-        now = datetime.utcnow().timestamp()
+        redis_key = RATE_LIMIT_KEY_PREFIXES[RateLimitStrategy.TOKEN_BUCKET] + key
 
-        bucket_data = await client.hgetall(redis_key)
+        is_allowed, remaining, retry_after = await _script(TOKEN_BUCKET_SCRIPT)(
+            keys=[redis_key], args=[capacity, refill_rate], client=valkey_client.client
+        )
 
-        if not bucket_data:
-            tokens = capacity - 1
-            last_refill = now
-            await client.hset(redis_key, mapping={"tokens": str(tokens), "last_refill": str(last_refill)})
-            await client.expire(redis_key, 3600)
-            return True, tokens, 0
-
-        tokens = float(bucket_data.get("tokens", 0))
-        last_refill = float(bucket_data.get("last_refill", now))
-
-        time_passed = now - last_refill
-        tokens_to_add = time_passed * refill_rate
-        tokens = min(capacity, tokens + tokens_to_add)
-
-        if tokens >= 1:
-            tokens -= 1
-            await client.hset(redis_key, mapping={"tokens": str(tokens), "last_refill": str(now)})
-            await client.expire(redis_key, 3600)
-            return True, int(tokens), 0
-        else:
-            tokens_needed = 1 - tokens
-            retry_after = int(tokens_needed / refill_rate) + 1
-            return False, 0, retry_after
+        return bool(is_allowed), remaining, retry_after
 
     @staticmethod
     async def reset_rate_limit(key: str):
         """Reset rate limit for a key (useful for testing or admin actions)"""
-        patterns = [f"rate_limit:fixed:{key}", f"rate_limit:sliding:{key}", f"rate_limit:bucket:{key}"]
-        for pattern in patterns:
-            await valkey_client.client.delete(pattern)
+        await valkey_client.client.unlink(*(prefix + key for prefix in RATE_LIMIT_KEY_PREFIXES.values()))
 
     @staticmethod
     async def get_rate_limit_info(key: str, strategy: RateLimitStrategy) -> dict:
         """Get current rate limit status without incrementing"""
+        client = valkey_client.client
+        redis_key = RATE_LIMIT_KEY_PREFIXES[strategy] + key
         if strategy == RateLimitStrategy.FIXED_WINDOW:
-            redis_key = f"rate_limit:fixed:{key}"
-            current = await valkey_client.client.get(redis_key)
-            ttl = await valkey_client.client.ttl(redis_key)
+            async with client.pipeline(transaction=False) as pipe:
+                current, ttl = await pipe.get(redis_key).ttl(redis_key).execute()
             return {"current_count": int(current) if current else 0, "reset_in": ttl if ttl > 0 else 0}
 
         elif strategy == RateLimitStrategy.SLIDING_WINDOW:
-            redis_key = f"rate_limit:sliding:{key}"
-            count = await valkey_client.client.zcard(redis_key)
+            count = await client.zcard(redis_key)
             return {"current_count": count, "window_type": "sliding"}
 
         elif strategy == RateLimitStrategy.TOKEN_BUCKET:
-            redis_key = f"rate_limit:bucket:{key}"
-            bucket_data = await valkey_client.client.hgetall(redis_key)
+            bucket_data = await client.hgetall(redis_key)
             return {
                 "tokens": float(bucket_data.get("tokens", 0)) if bucket_data else 0,
                 "last_refill": bucket_data.get("last_refill") if bucket_data else None,
@@ -182,6 +223,10 @@ class RateLimiter:
 class CooldownManager:
     """Simplified cooldown manager for specific actions"""
 
+    @staticmethod
+    def _key(user_id: uuid.UUID, action: str) -> str:
+        return f"cooldown:{action}:{user_id}"
+
     @staticmethod
     async def check_cooldown(user_id: uuid.UUID, action: str, cooldown_seconds: int) -> Tuple[bool, int]:
         """
@@ -190,27 +235,23 @@ class CooldownManager:
         Returns:
             Tuple of (can_perform, seconds_remaining)
         """
-        key = f"cooldown:{action}:{user_id}"
-        client = valkey_client.client
-
-        exists = await client.exists(key)
+        key = CooldownManager._key(user_id, action)
 
-        if exists:
-            ttl = await client.ttl(key)
-            return False, ttl
+        ttl = await _script(COOLDOWN_SCRIPT)(keys=[key], args=[cooldown_seconds], client=valkey_client.client)
 
-        await client.setex(key, cooldown_seconds, "1")
+        if ttl:
+            return False, ttl if ttl > 0 else cooldown_seconds
         return True, 0
 
     @staticmethod
     async def reset_cooldown(user_id: uuid.UUID, action: str):
         """Reset cooldown for a user action"""
-        key = f"cooldown:{action}:{user_id}"
+        key = CooldownManager._key(user_id, action)
         await valkey_client.client.delete(key)
 
     @staticmethod
     async def get_remaining_cooldown(user_id: uuid.UUID, action: str) -> int:
         """Get remaining cooldown time in seconds"""
-        key = f"cooldown:{action}:{user_id}"
+        key = CooldownManager._key(user_id, action)
         ttl = await valkey_client.client.ttl(key)
         return ttl if ttl > 0 else 0
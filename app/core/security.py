@@ -1,46 +1,135 @@
 from __future__ import annotations
 
-import datetime
+import threading
+import time
 import uuid
-from datetime import timedelta
+from collections import OrderedDict
+from functools import lru_cache
 from typing import Optional
 
 import bcrypt
+import jwt
+from argon2 import PasswordHasher
+from argon2.exceptions import InvalidHashError, VerificationError
 from fastapi import HTTPException
-from jose import JWTError, jwt
+from jwt import PyJWTError
 from starlette import status
+from starlette.requests import HTTPConnection
 
 from app.core.config import settings
 
+# Token lifetimes in seconds; exp is a plain unix timestamp
+ACCESS_TOKEN_TTL_SECONDS = settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60
+REFRESH_TOKEN_TTL_SECONDS = settings.REFRESH_TOKEN_EXPIRE_DAYS * 24 * 3600
+
+# HMAC key encoded once instead of on every encode/decode
+_JWT_KEY = settings.SECRET_KEY.encode()
+
+# Bounded LRU of verified token payloads with the time each entry stops being served
+_decoded_tokens: "OrderedDict[str, tuple[dict, float]]" = OrderedDict()
+# Sync endpoints decode tokens from the threadpool, so every cache access goes through this lock
+_decoded_tokens_lock = threading.Lock()
+
+
+# Shared argon2id hasher; the defaults are the OWASP baseline (19 MiB, 2 iterations, 1 lane)
+_password_hasher = PasswordHasher(
+    time_cost=settings.PASSWORD_HASH_TIME_COST,
+    memory_cost=settings.PASSWORD_HASH_MEMORY_KIB,
+    parallelism=settings.PASSWORD_HASH_PARALLELISM,
+)
+
 
 def hash_password(password: str) -> str:
-    return bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt()).decode("utf-8")
+    return _password_hasher.hash(password)
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
-    return bcrypt.checkpw(plain_password.encode("utf-8"), hashed_password.encode("utf-8"))
+    """Verify against argon2id hashes, falling back to bcrypt for hashes created before the switch."""
+    if hashed_password.startswith("$argon2"):
+        try:
+            return _password_hasher.verify(hashed_password, plain_password)
+        except (VerificationError, InvalidHashError):
+            return False
+    return bcrypt.checkpw(plain_password.encode("utf-8"), hashed_password.encode("ascii"))
+
+
+def password_needs_rehash(hashed_password: str) -> bool:
+    """True for legacy bcrypt hashes and argon2id hashes made with outdated parameters."""
+    if not hashed_password.startswith("$argon2"):
+        return True
+    try:
+        return _password_hasher.check_needs_rehash(hashed_password)
+    except InvalidHashError:
+        return True
 
 
 def create_access_token(data: dict, expire_minutes: Optional[int] = None):
     to_encode = data.copy()
-    expire = datetime.datetime.now(datetime.UTC) + timedelta(
-        minutes=expire_minutes or settings.ACCESS_TOKEN_EXPIRE_MINUTES
-    )
-    to_encode.update({"exp": expire, "type": "access", "jti": str(uuid.uuid4())})
-    return jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
+    expire = int(time.time()) + (expire_minutes * 60 if expire_minutes else ACCESS_TOKEN_TTL_SECONDS)
+    to_encode.update({"exp": expire, "type": "access", "jti": uuid.uuid4().hex})
+    return jwt.encode(to_encode, _JWT_KEY, algorithm=settings.ALGORITHM)
 
 
 def create_refresh_token(data: dict):
     to_encode = data.copy()
-    expire = datetime.datetime.now(datetime.UTC) + timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS)
-    to_encode.update({"exp": expire, "type": "refresh", "jti": str(uuid.uuid4())})
-    return jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
+    expire = int(time.time()) + REFRESH_TOKEN_TTL_SECONDS
+    to_encode.update({"exp": expire, "type": "refresh", "jti": uuid.uuid4().hex})
+    return jwt.encode(to_encode, _JWT_KEY, algorithm=settings.ALGORITHM)
+
+
+def decode_token(token: str) -> dict:
+    """
+    Decode and verify a JWT, reusing the result for tokens that were already verified.
+    Entries live for at most JWT_DECODE_CACHE_TTL_SECONDS and never past the token's own expiry.
+    Raises PyJWTError on invalid or expired tokens; failures are never cached.
+    """
+    now = time.time()
+    with _decoded_tokens_lock:
+        entry = _decoded_tokens.get(token)
+        if entry is not None:
+            payload, expires_at = entry
+            if now < expires_at:
+                _decoded_tokens.move_to_end(token)
+                # Callers own the returned dict; the cached payload is never handed out
+                return dict(payload)
+            del _decoded_tokens[token]
+
+    payload = jwt.decode(token, _JWT_KEY, algorithms=[settings.ALGORITHM])
+    expires_at = now + settings.JWT_DECODE_CACHE_TTL_SECONDS
+    if "exp" in payload:
+        expires_at = min(expires_at, payload["exp"])
+    with _decoded_tokens_lock:
+        _decoded_tokens[token] = (dict(payload), expires_at)
+        if len(_decoded_tokens) > settings.JWT_DECODE_CACHE_SIZE:
+            _decoded_tokens.popitem(last=False)
+    return payload
+
+
+def decode_request_token(conn: HTTPConnection, token: str) -> dict:
+    """Decode the request's bearer token once and share the payload on conn.state with later consumers."""
+    payload = getattr(conn.state, "jwt_payload", None)
+    if payload is None:
+        payload = decode_token(token)
+        conn.state.jwt_payload = payload
+    return payload
+
+
+def forget_token(token: str) -> None:
+    """Drop a token from the decode cache, e.g. on logout."""
+    with _decoded_tokens_lock:
+        _decoded_tokens.pop(token, None)
+
+
+@lru_cache(maxsize=settings.JWT_DECODE_CACHE_SIZE)
+def parse_user_id(sub: str) -> uuid.UUID:
+    """Parse a token's "sub" claim; each active user's id is parsed once instead of on every request."""
+    return uuid.UUID(sub)
 
 
-def get_payload(token: str) -> dict:
+def get_payload(token: str, conn: Optional[HTTPConnection] = None) -> dict:
     try:
-        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
-    except JWTError:
+        payload = decode_token(token) if conn is None else decode_request_token(conn, token)
+    except PyJWTError:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Could not validate credentials",
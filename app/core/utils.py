@@ -1,16 +1,37 @@
 from sqlalchemy.exc import IntegrityError
 
+# PostgreSQL SQLSTATE codes for integrity violations
+UNIQUE_VIOLATION = "23505"
+CONSTRAINT_MESSAGES = {
+    "23503": "Invalid reference to related resource",
+    "23502": "Missing required field",
+    "23514": "Invalid field value",
+}
+
+
+def _unique_violation_message(detail: str) -> str:
+    if "email" in detail:
+        return "Email already exists"
+    elif "username" in detail:
+        return "Username already taken"
+    return "This value already exists"
+
 
 def extract_constraint_info(exc: IntegrityError) -> str:
     """Extract constraint violation info safely without leaking DB details."""
+    # psycopg exposes the SQLSTATE and constraint name directly, no need to format the message
+    pgcode = getattr(exc.orig, "pgcode", None)
+    if pgcode:
+        if pgcode == UNIQUE_VIOLATION:
+            diag = getattr(exc.orig, "diag", None)
+            constraint_name = getattr(diag, "constraint_name", None) or str(exc.orig)
+            return _unique_violation_message(constraint_name.lower())
+        return CONSTRAINT_MESSAGES.get(pgcode, "Database operation failed")
+
     error_msg = str(exc.orig).lower()
 
     if "unique constraint" in error_msg or "duplicate" in error_msg:
-        if "email" in error_msg:
-            return "Email already exists"
-        elif "username" in error_msg:
-            return "Username already taken"
-        return "This value already exists"
+        return _unique_violation_message(error_msg)
 
     elif "foreign key constraint" in error_msg:
         return "Invalid reference to related resource"
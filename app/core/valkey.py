@@ -1,16 +1,42 @@
-import json
+import asyncio
+import logging
+from functools import singledispatch
 from typing import Any, Optional
 
+import orjson
 import redis.asyncio as redis
+from pydantic import BaseModel
 
 from app.core.config import settings
 
+logger = logging.getLogger(__name__)
+
+PUBLISH_BATCH_SIZE = 100
+PUBLISH_FLUSH_INTERVAL_SECONDS = 0.002
+PUBLISH_QUEUE_SIZE = 10_000
+PUBLISH_DRAIN_TIMEOUT_SECONDS = 5.0
+
+
+@singledispatch
+def _to_serializable(obj: Any) -> Any:
+    """orjson fallback for types it cannot encode natively."""
+    return obj.__dict__
+
+
+@_to_serializable.register
+def _(obj: BaseModel) -> Any:
+    return obj.model_dump(mode="json")
+
 
 class ValkeyClient:
+    __slots__ = ("_url", "_use_fake", "_client", "_publish_queue", "_publish_task")
+
     def __init__(self, url: str, use_fake: bool = False):
         self._url = url
         self._use_fake = use_fake
         self._client: Optional[redis.Redis] = None
+        self._publish_queue: Optional[asyncio.Queue] = None
+        self._publish_task: Optional[asyncio.Task] = None
 
     async def connect(self):
         if self._client:
@@ -21,9 +47,18 @@ class ValkeyClient:
 
             self._client = fake_redis.FakeRedis(decode_responses=True, encoding="utf-8")
         else:
-            self._client = redis.from_url(self._url, encoding="utf-8", decode_responses=True, max_connections=50)
+            self._client = redis.from_url(
+                self._url,
+                encoding="utf-8",
+                decode_responses=True,
+                max_connections=50,
+                socket_keepalive=True,
+                health_check_interval=settings.VALKEY_HEALTH_CHECK_INTERVAL,
+            )
 
     async def disconnect(self):
+        if self._publish_task:
+            await self._stop_publisher()
         if self._client and not self._use_fake:
             await self._client.close()
         self._client = None
@@ -35,26 +70,91 @@ class ValkeyClient:
         return self._client
 
     async def publish(self, channel: str, message: dict | str) -> int:
-        payload = json.dumps(message) if isinstance(message, dict) else message
+        payload = orjson.dumps(message) if isinstance(message, dict) else message
         return await self.client.publish(channel, payload)
 
-    async def set(self, key: str, value: Any, ttl: int = settings.VALKEY_TTL):
-        def serializer(obj):
-            if hasattr(obj, "model_dump"):
-                return obj.model_dump(mode="json")
-            return obj.__dict__
+    async def publish_many(self, channels: list[str], message: dict | str) -> list[int]:
+        """Publish one message to several channels, encoding it once and pipelining the PUBLISHes."""
+        payload = orjson.dumps(message) if isinstance(message, dict) else message
+        async with self.pipeline() as pipe:
+            for channel in channels:
+                pipe.publish(channel, payload)
+            return await pipe.execute()
+
+    def publish_nowait(self, channel: str, message: dict | str) -> None:
+        """
+        Queue a message for the background publisher instead of waiting on the reply.
+        Meant for best-effort events where the subscriber count does not matter.
+        """
+        if self._publish_task is None or self._publish_task.done():
+            self._publish_queue = asyncio.Queue(maxsize=PUBLISH_QUEUE_SIZE)
+            self._publish_task = asyncio.create_task(self._drain_publish_queue(self._publish_queue))
+
+        payload = orjson.dumps(message) if isinstance(message, dict) else message
+        try:
+            self._publish_queue.put_nowait((channel, payload))
+        except asyncio.QueueFull:
+            logger.warning("Valkey publish queue full, dropping message for %s", channel)
+
+    async def _drain_publish_queue(self, queue: asyncio.Queue):
+        """Flush queued publishes in pipelined batches of up to PUBLISH_BATCH_SIZE."""
+        while True:
+            batch = [await queue.get()]
+            await asyncio.sleep(PUBLISH_FLUSH_INTERVAL_SECONDS)
+            while len(batch) < PUBLISH_BATCH_SIZE and not queue.empty():
+                batch.append(queue.get_nowait())
+
+            try:
+                async with self.pipeline() as pipe:
+                    for channel, payload in batch:
+                        pipe.publish(channel, payload)
+                    await pipe.execute(raise_on_error=False)
+            except Exception as e:
+                logger.warning("Dropped %d queued Valkey publishes: %s", len(batch), e)
+            finally:
+                for _ in batch:
+                    queue.task_done()
+
+    async def _stop_publisher(self):
+        """Let the background publisher flush what is queued, then stop it."""
+        task, queue = self._publish_task, self._publish_queue
+        self._publish_task = self._publish_queue = None
+        if not task.done():
+            try:
+                await asyncio.wait_for(queue.join(), PUBLISH_DRAIN_TIMEOUT_SECONDS)
+            except asyncio.TimeoutError:
+                logger.warning("Dropped %d queued Valkey publishes on disconnect", queue.qsize())
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+    @staticmethod
+    def _dumps(value: Any) -> bytes:
+        return orjson.dumps(value, default=_to_serializable, option=orjson.OPT_NON_STR_KEYS)
+
+    def pipeline(self, transaction: bool = False) -> redis.client.Pipeline:
+        """Queue several commands and send them in one round trip with ``await pipe.execute()``."""
+        return self.client.pipeline(transaction=transaction)
 
-        await self.client.setex(key, ttl, json.dumps(value, default=serializer))
+    async def set(self, key: str, value: Any, ttl: int = settings.VALKEY_TTL):
+        await self.client.setex(key, ttl, self._dumps(value))
 
     async def unset(self, key: str):
         await self.client.delete(key)
 
+    async def munset(self, keys: list[str]):
+        if keys:
+            await self.client.delete(*keys)
+
     async def get(self, key: str) -> Optional[Any]:
         val = await self.client.get(key)
-        return json.loads(val) if val else None
+        return orjson.loads(val) if val else None
 
-    async def has(self, key: str) -> bool:
-        return await self.client.exists(key)
+    async def has(self, *keys: str) -> int:
+        """Return how many of the given keys exist."""
+        return await self.client.exists(*keys)
 
     def raw(self):
         return self.client
@@ -1,3 +1,4 @@
+import asyncio
 import datetime
 import re
 import secrets
@@ -6,13 +7,21 @@ from typing import Optional
 
 from authlib.integrations.starlette_client import OAuth
 from fastapi import HTTPException, status
-from jose import JWTError, jwt
+from jwt import PyJWTError
 from sqlalchemy.orm import Session
 from starlette.requests import Request
 
 from app.core.config import settings
 from app.core.email_service import email_service
-from app.core.security import create_access_token, create_refresh_token, hash_password, verify_password
+from app.core.security import (
+    create_access_token,
+    create_refresh_token,
+    decode_token,
+    forget_token,
+    hash_password,
+    password_needs_rehash,
+    verify_password,
+)
 from app.core.valkey import valkey_client
 from app.domains import UserRepository
 from app.domains.auth.password_validator import PasswordValidator
@@ -41,7 +50,7 @@ class AuthService:
         else:
             user = self.user_repository.get_by_username(login_request.username)
 
-        if not user or not verify_password(login_request.password, user.password):
+        if not user or not await asyncio.to_thread(verify_password, login_request.password, user.password):
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Invalid credentials",
@@ -53,6 +62,11 @@ class AuthService:
                 detail="User account is inactive",
             )
 
+        # Upgrade bcrypt (or outdated argon2) hashes while the plain password is at hand
+        if password_needs_rehash(user.password):
+            user.password = await asyncio.to_thread(hash_password, login_request.password)
+            self.db.commit()
+
         data = create_payload_from_user(user)
         access_token = create_access_token(data=data)
         refresh_token = create_refresh_token(data=data)
@@ -67,6 +81,7 @@ class AuthService:
     async def invalidate_tokens(self, token: str) -> bool:
         """Invalidate all tokens for a given user"""
         token_payload = await self._verify_token(token)
+        forget_token(token)
         user_id: str = token_payload["sub"]
         if not await valkey_client.has(user_id):
             return False
@@ -76,6 +91,7 @@ class AuthService:
     async def invalidate_token(self, token: str) -> bool:
         """Invalidate the given token and its refresh for a user"""
         token_payload = await self._verify_token(token)
+        forget_token(token)
         user_id: str = token_payload["sub"]
         token_store: Optional[list] = await valkey_client.get(user_id)
         if not token_store:
@@ -130,7 +146,7 @@ class AuthService:
             str(user.id),
         )
 
-        email_service.send_verification_email(
+        await email_service.send_verification_email(
             to_email=user.email,
             token=token,
             username=user.username,
@@ -193,7 +209,7 @@ class AuthService:
             str(user.id),
         )
 
-        email_service.send_password_reset_email(
+        await email_service.send_password_reset_email(
             to_email=user.email,
             token=token,
             username=user.username,
@@ -224,9 +240,9 @@ class AuthService:
                 detail="User not found",
             )
 
-        self.password_validator.validate_and_check_history(user_id, new_password)
+        await asyncio.to_thread(self.password_validator.validate_and_check_history, user_id, new_password)
 
-        hashed = hash_password(new_password)
+        hashed = await asyncio.to_thread(hash_password, new_password)
 
         self.password_validator.add_to_history(user_id, user.password)
 
@@ -251,15 +267,15 @@ class AuthService:
                 detail="User not found",
             )
 
-        if not verify_password(current_password, user.password):
+        if not await asyncio.to_thread(verify_password, current_password, user.password):
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Current password is incorrect",
             )
 
-        self.password_validator.validate_and_check_history(user_id, new_password)
+        await asyncio.to_thread(self.password_validator.validate_and_check_history, user_id, new_password)
 
-        hashed = hash_password(new_password)
+        hashed = await asyncio.to_thread(hash_password, new_password)
 
         self.password_validator.add_to_history(user_id, user.password)
 
@@ -313,7 +329,7 @@ class AuthService:
     async def _verify_token(token: str, expected_type: str = None) -> dict:
         """Verify and decode a JWT token."""
         try:
-            payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+            payload = decode_token(token)
             user_id = payload.get("sub")
             username = payload.get("username")
             email = payload.get("email")
@@ -342,7 +358,7 @@ class AuthService:
                     )
 
             return payload
-        except JWTError:
+        except PyJWTError:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Invalid or expired token",
@@ -5,6 +5,7 @@ import uuid
 from typing import TYPE_CHECKING
 
 from fastapi import HTTPException
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 from starlette import status
 
@@ -60,16 +61,15 @@ class PasswordValidator:
         """
         Check that the new password hasn't been used recently.
         """
-        history_entries = (
-            self.db.query(PasswordHistory)
+        stmt = (
+            select(PasswordHistory.password_hash)
             .filter(PasswordHistory.user_id == user_id)
             .order_by(PasswordHistory.created_at.desc())
             .limit(settings.PASSWORD_HISTORY_COUNT)
-            .all()
         )
 
-        for entry in history_entries:
-            if verify_password(new_password, entry.password_hash):
+        for password_hash in self.db.scalars(stmt):
+            if verify_password(new_password, password_hash):
                 raise HTTPException(
                     status_code=status.HTTP_400_BAD_REQUEST,
                     detail=f"Password was used recently. Please choose a different password. "
@@ -2,9 +2,11 @@ import datetime
 import uuid
 from typing import List, Optional
 
-from sqlalchemy import select
+from sqlalchemy import exists, insert, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.exc import IntegrityError
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, with_expression
 
 from app.literals.channels import ChannelRole
 from app.literals.users import ROLE_HIERARCHY
@@ -31,6 +33,10 @@ class ChannelRepository(BaseRepository[Channel]):
             self.db.rollback()
             raise
 
+    def exists(self, channel_id: uuid.UUID) -> bool:
+        """Check whether a channel exists without loading it."""
+        return bool(self.db.scalar(select(exists().where(Channel.id == channel_id))))
+
     def get_all(
         self,
         skip: int = 0,
@@ -38,7 +44,7 @@ class ChannelRepository(BaseRepository[Channel]):
         channel_type: Optional[str] = None,
     ) -> List[Channel]:
         """Get all channels with optional filtering."""
-        stmt = select(Channel)
+        stmt = select(Channel).options(with_expression(Channel.loaded_members_count, Channel.members_count))
 
         if channel_type is not None:
             stmt = stmt.filter(Channel.channel_type == channel_type)
@@ -54,7 +60,13 @@ class ChannelRepository(BaseRepository[Channel]):
     ) -> List[Channel]:
         """Get channels visible to a user with a specific permission level."""
         visible_roles = [role for role, level in ROLE_HIERARCHY.items() if level >= user_permission_level]
-        stmt = select(Channel).filter(Channel.required_role_read.in_(visible_roles)).offset(skip).limit(limit)
+        stmt = (
+            select(Channel)
+            .options(with_expression(Channel.loaded_members_count, Channel.members_count))
+            .filter(Channel.required_role_read.in_(visible_roles))
+            .offset(skip)
+            .limit(limit)
+        )
         return list(self.db.scalars(stmt).all())
 
     def update(self, channel_id: uuid.UUID, update_data: dict) -> Optional[Channel]:
@@ -82,14 +94,19 @@ class ChannelRepository(BaseRepository[Channel]):
         if not channel:
             return None
 
-        existing = self.get_member(channel_id, user_id)
-        if existing:
-            return existing
+        # A single INSERT ... ON CONFLICT DO NOTHING, so concurrent joins cannot race on the primary key
+        insert_stmt = pg_insert if self.db.get_bind().dialect.name == "postgresql" else sqlite_insert
+        stmt = (
+            insert_stmt(ChannelMember)
+            .values(channel_id=channel_id, user_id=user_id, role=role)
+            .on_conflict_do_nothing(index_elements=["channel_id", "user_id"])
+            .returning(ChannelMember)
+        )
+        membership = self.db.scalar(stmt)
+        if membership is None:
+            return self.get_member(channel_id, user_id)
 
-        membership = ChannelMember(channel_id=channel_id, user_id=user_id, role=role)
-        self.db.add(membership)
         self.db.commit()
-        self.db.refresh(membership)
         return membership
 
     def bulk_add_members(self, memberships: List[dict]) -> None:
@@ -107,12 +124,11 @@ class ChannelRepository(BaseRepository[Channel]):
 
     def get_members(self, channel_id: uuid.UUID) -> Optional[List[ChannelMember]]:
         """Get all members of a channel."""
-        channel = self.get_by_id(channel_id)
-        if not channel:
-            return None
-
         stmt = select(ChannelMember).filter(ChannelMember.channel_id == channel_id)
-        return list(self.db.scalars(stmt).all())
+        members = list(self.db.scalars(stmt).all())
+        if not members and not self.exists(channel_id):
+            return None
+        return members
 
     def update_member_role(
         self,
@@ -127,7 +143,6 @@ class ChannelRepository(BaseRepository[Channel]):
 
         membership.role = new_role
         self.db.commit()
-        self.db.refresh(membership)
         return membership
 
     def remove_member(self, channel_id: uuid.UUID, user_id: uuid.UUID) -> Optional[ChannelMember]:
@@ -140,6 +155,27 @@ class ChannelRepository(BaseRepository[Channel]):
         self.db.commit()
         return membership
 
+    def _set_banned(self, channel_id: uuid.UUID, user_id: uuid.UUID, is_banned: bool) -> bool:
+        """
+        Flag the membership and close any active bans with bulk UPDATEs, without committing.
+
+        :return: False if the channel does not exist.
+        """
+        flagged = self.db.execute(
+            update(ChannelMember)
+            .where(ChannelMember.channel_id == channel_id, ChannelMember.user_id == user_id)
+            .values(is_banned=is_banned)
+        )
+        if not flagged.rowcount and not self.exists(channel_id):
+            return False
+
+        self.db.execute(
+            update(ChannelBan)
+            .where(ChannelBan.channel_id == channel_id, ChannelBan.user_id == user_id, ChannelBan.active)
+            .values(active=False)
+        )
+        return True
+
     def ban_member(
         self,
         channel_id: uuid.UUID,
@@ -149,34 +185,22 @@ class ChannelRepository(BaseRepository[Channel]):
         banned_by: Optional[uuid.UUID] = None,
     ) -> Optional[ChannelBan]:
         """Ban a user from a channel."""
-        channel = self.get_by_id(channel_id)
-        if not channel:
+        if not self._set_banned(channel_id, user_id, True):
             return None
 
-        membership = self.get_member(channel_id, user_id)
-        if membership:
-            membership.is_banned = True
-
-        stmt = select(ChannelBan).filter(
-            ChannelBan.channel_id == channel_id,
-            ChannelBan.user_id == user_id,
-            ChannelBan.active,
+        ban = self.db.scalar(
+            insert(ChannelBan)
+            .values(
+                channel_id=channel_id,
+                user_id=user_id,
+                motive=motive,
+                duration=duration,
+                active=True,
+                banned_by=banned_by,
+            )
+            .returning(ChannelBan)
         )
-        active_bans = list(self.db.scalars(stmt).all())
-        for ban in active_bans:
-            ban.active = False
-
-        ban = ChannelBan(
-            channel_id=channel_id,
-            user_id=user_id,
-            motive=motive,
-            duration=duration,
-            active=True,
-            banned_by=banned_by,
-        )
-        self.db.add(ban)
         self.db.commit()
-        self.db.refresh(ban)
         return ban
 
     def unban_member(
@@ -187,30 +211,18 @@ class ChannelRepository(BaseRepository[Channel]):
         unbanned_by: Optional[uuid.UUID] = None,
     ) -> Optional[ChannelUnban]:
         """Unban a member from a channel."""
-        channel = self.get_by_id(channel_id)
-        if not channel:
+        if not self._set_banned(channel_id, user_id, False):
             return None
 
-        membership = self.get_member(channel_id, user_id)
-        if membership:
-            membership.is_banned = False
-
-        stmt = select(ChannelBan).filter(
-            ChannelBan.channel_id == channel_id,
-            ChannelBan.user_id == user_id,
-            ChannelBan.active,
-        )
-        active_bans = list(self.db.scalars(stmt).all())
-        for ban in active_bans:
-            ban.active = False
-
-        unban = ChannelUnban(
-            channel_id=channel_id,
-            user_id=user_id,
-            motive=motive,
-            unbanned_by=unbanned_by,
+        unban = self.db.scalar(
+            insert(ChannelUnban)
+            .values(
+                channel_id=channel_id,
+                user_id=user_id,
+                motive=motive,
+                unbanned_by=unbanned_by,
+            )
+            .returning(ChannelUnban)
         )
-        self.db.add(unban)
         self.db.commit()
-        self.db.refresh(unban)
         return unban
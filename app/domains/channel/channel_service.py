@@ -36,6 +36,7 @@ class ChannelService:
             channel_data = channel_in.model_dump()
             channel = self.repository.create(channel_data)
             self.repository.add_member(channel.id, creator_id, role=ChannelRole.ADMIN)
+            await ws_service.invalidate_channel_subscriptions(creator_id)
 
             await ws_service.send_channel_created(
                 channel_id=channel.id,
@@ -73,7 +74,10 @@ class ChannelService:
             user_level = ROLE_HIERARCHY.get(user_role or Role.BASIC, ROLE_HIERARCHY[Role.BASIC])
             channels = self.repository.get_public_channels(user_level, skip, limit)
 
-        return [ChannelReadWithCount.model_validate(ch) for ch in channels]
+        # Rows come straight from the channel table and the endpoint validates its response model,
+        # so skip the first validation pass; every field maps to a typed column or enum.
+        fields = ChannelReadWithCount.model_fields
+        return [ChannelReadWithCount.model_construct(**{name: getattr(ch, name) for name in fields}) for ch in channels]
 
     async def update_channel(self, channel_id: uuid.UUID, channel_in: ChannelUpdate) -> ChannelRead:
         """Update a channel."""
@@ -104,7 +108,9 @@ class ChannelService:
 
         await ws_service.send_channel_deleted(channel_id=channel_id)
 
+        member_ids = [membership.user_id for membership in channel.memberships]
         self.repository.delete(channel)
+        await ws_service.invalidate_channel_subscriptions(*member_ids)
         return True
 
     async def add_member(
@@ -118,6 +124,7 @@ class ChannelService:
                 detail="Channel not found",
             )
 
+        await ws_service.invalidate_channel_subscriptions(user_id)
         await ws_service.send_member_joined(
             channel_id=channel_id,
             user_id=user_id,
@@ -134,6 +141,7 @@ class ChannelService:
                 detail="Member not found",
             )
 
+        await ws_service.invalidate_channel_subscriptions(user_id)
         await ws_service.send_user_kicked(
             channel_id=channel_id,
             user_id=user_id,
@@ -209,6 +217,7 @@ class ChannelService:
 
         membership = self.repository.add_member(channel_id, user_id, ChannelRole.USER)
 
+        await ws_service.invalidate_channel_subscriptions(user_id)
         await ws_service.send_member_joined(
             channel_id=channel_id,
             user_id=user_id,
@@ -225,6 +234,7 @@ class ChannelService:
                 detail="You are not a member of this channel",
             )
 
+        await ws_service.invalidate_channel_subscriptions(user_id)
         await ws_service.send_member_left(
             channel_id=channel_id,
             user_id=user_id,
@@ -248,6 +258,7 @@ class ChannelService:
                 detail="Channel or member not found",
             )
 
+        await ws_service.invalidate_channel_subscriptions(user_id)
         await ws_service.send_user_banned(
             channel_id=channel_id,
             user_id=user_id,
@@ -273,6 +284,7 @@ class ChannelService:
                 detail="Channel not found",
             )
 
+        await ws_service.invalidate_channel_subscriptions(user_id)
         await ws_service.send_user_unbanned(
             channel_id=channel_id,
             user_id=user_id,
@@ -1,7 +1,7 @@
 import uuid
 from typing import List, Optional
 
-from sqlalchemy import select
+from sqlalchemy import insert, select
 from sqlalchemy.exc import NoResultFound
 from sqlalchemy.orm import Session
 
@@ -26,11 +26,16 @@ class FileAssociationRepository(BaseRepository[FileAssociation]):
 
     def bulk_create(self, associations_data: List[dict]) -> List[FileAssociation]:
         """Create multiple file associations at once."""
-        associations = [FileAssociation(**data) for data in associations_data]
-        self.db.add_all(associations)
+        if not associations_data:
+            return []
+
+        stmt = insert(FileAssociation).returning(FileAssociation, sort_by_parameter_order=True)
+        associations = list(self.db.scalars(stmt, associations_data).all())
+        association_ids = [assoc.id for assoc in associations]
         self.db.commit()
-        for assoc in associations:
-            self.db.refresh(assoc)
+
+        # Reload the rows expired by the commit with one query instead of a refresh per row
+        self.db.scalars(select(FileAssociation).filter(FileAssociation.id.in_(association_ids))).all()
         return associations
 
     def get_by_entity(
@@ -126,21 +131,22 @@ class FileAssociationRepository(BaseRepository[FileAssociation]):
         Reorder file associations for an entity.
         Pass a list of association IDs in the desired order.
         """
+        stmt = select(FileAssociation).filter(
+            FileAssociation.id.in_(ordered_association_ids),
+            FileAssociation.entity_type == entity_type,
+            FileAssociation.entity_id == entity_id,
+        )
+        associations_by_id = {assoc.id: assoc for assoc in self.db.scalars(stmt)}
+
         associations = []
         for index, assoc_id in enumerate(ordered_association_ids):
-            stmt = select(FileAssociation).filter(
-                FileAssociation.id == assoc_id,
-                FileAssociation.entity_type == entity_type,
-                FileAssociation.entity_id == entity_id,
-            )
-            association = self.db.scalar(stmt)
-
+            association = associations_by_id.get(assoc_id)
             if association:
                 association.order = index
                 associations.append(association)
 
         self.db.commit()
-        for assoc in associations:
-            self.db.refresh(assoc)
 
+        # Reload the rows expired by the commit with one query instead of a refresh per row
+        self.db.scalars(select(FileAssociation).filter(FileAssociation.id.in_(list(associations_by_id)))).all()
         return associations
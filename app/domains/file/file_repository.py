@@ -1,7 +1,7 @@
 import uuid
 from typing import List, Optional
 
-from sqlalchemy import select
+from sqlalchemy import select, update
 from sqlalchemy.exc import NoResultFound
 from sqlalchemy.orm import Session
 
@@ -50,19 +50,19 @@ class FileRepository(BaseRepository[File]):
 
     def soft_delete(self, file_id: uuid.UUID) -> bool:
         """Soft delete a file by marking it as deleted."""
-        file = self.get_by_id(file_id)
-        if not file:
+        stmt = update(File).filter(File.id == file_id, File.deleted.is_(False)).values(deleted=True)
+        if not self.db.execute(stmt).rowcount:
             raise NoResultFound("File not found")
-        file.deleted = True
         self.db.commit()
         return True
 
     def update_visibility(self, file_id: uuid.UUID, is_public: bool) -> File:
         """Update the public visibility of a file."""
-        file = self.get_by_id(file_id)
+        stmt = (
+            update(File).filter(File.id == file_id, File.deleted.is_(False)).values(is_public=is_public).returning(File)
+        )
+        file = self.db.scalar(stmt)
         if not file:
             raise NoResultFound("File not found")
-        file.is_public = is_public
         self.db.commit()
-        self.db.refresh(file)
         return file
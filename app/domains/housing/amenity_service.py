@@ -1,6 +1,7 @@
 from typing import List
 
 from fastapi import HTTPException
+from pydantic import TypeAdapter
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
@@ -10,6 +11,9 @@ from app.schemas.housing_amenity import (
     HousingAmenityRead,
 )
 
+# Built once at import: validates a whole page of rows in a single pydantic-core call
+AMENITY_LIST_ADAPTER = TypeAdapter(List[HousingAmenityRead])
+
 
 class HousingAmenityService:
     """Service layer for housing amenity business logic."""
@@ -37,7 +41,7 @@ class HousingAmenityService:
     def list_amenities(self, skip: int = 0, limit: int = 100) -> List[HousingAmenityRead]:
         """List all amenities."""
         amenities = self.repository.get_all(skip, limit)
-        return [HousingAmenityRead.model_validate(a) for a in amenities]
+        return AMENITY_LIST_ADAPTER.validate_python(amenities, from_attributes=True)
 
     def delete_amenity(self, code: int) -> None:
         """Delete an amenity."""
@@ -2,6 +2,7 @@ import uuid
 from typing import List
 
 from fastapi import HTTPException
+from pydantic import TypeAdapter
 from sqlalchemy.orm import Session
 
 from app.domains.housing.category_repository import HousingCategoryRepository
@@ -12,6 +13,9 @@ from app.schemas import (
     HousingCategoryUpdate,
 )
 
+# Built once at import: validates a whole page of rows in a single pydantic-core call
+CATEGORY_LIST_ADAPTER = TypeAdapter(List[HousingCategoryList])
+
 
 class HousingCategoryService:
     """Service layer for housing category business logic."""
@@ -36,7 +40,7 @@ class HousingCategoryService:
     def list_categories(self, skip: int = 0, limit: int = 100) -> List[HousingCategoryList]:
         """List all categories."""
         categories = self.repository.get_all(skip, limit)
-        return [HousingCategoryList.model_validate(cat) for cat in categories]
+        return CATEGORY_LIST_ADAPTER.validate_python(categories, from_attributes=True)
 
     def update_category(self, category_id: uuid.UUID, category_update: HousingCategoryUpdate) -> HousingCategoryRead:
         """Update a category."""
@@ -1,7 +1,7 @@
 import uuid
 from typing import List, Optional
 
-from sqlalchemy import desc, func, or_, select
+from sqlalchemy import desc, func, or_, select, update
 from sqlalchemy.orm import Session
 
 from app.models import Conversation, ConversationMessage
@@ -104,11 +104,11 @@ class ConversationRepository(BaseRepository[Conversation]):
             content=content,
         )
         self.db.add(message)
+        self.db.flush()
 
-        stmt = select(Conversation).filter(Conversation.id == conversation_id)
-        conversation = self.db.scalar(stmt)
-        if conversation:
-            conversation.last_message_at = message.created_at
+        self.db.execute(
+            update(Conversation).filter(Conversation.id == conversation_id).values(last_message_at=message.created_at)
+        )
 
         self.db.commit()
         self.db.refresh(message)
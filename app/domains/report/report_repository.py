@@ -24,11 +24,6 @@ class ReportRepository(BaseRepository[Report]):
         self.db.refresh(report)
         return report
 
-    def get_by_id(self, report_id: uuid.UUID) -> Optional[Report]:
-        """Get report by ID with all relationships loaded."""
-        stmt = select(Report).filter(Report.id == report_id)
-        return self.db.scalars(stmt).first()
-
     def get_paginated(
         self,
         skip: int = 0,
@@ -1,4 +1,3 @@
-import uuid
 from typing import List, Optional
 
 from sqlalchemy import select
@@ -32,11 +31,6 @@ class TermsRepository(BaseRepository[TermsTableModel]):
             self.db.rollback()
             raise
 
-    def get_by_id(self, terms_id: uuid.UUID) -> Optional[TermsTableModel]:
-        """Get terms entry by ID."""
-        stmt = select(TermsTableModel).filter(TermsTableModel.id == terms_id)
-        return self.db.scalar(stmt)
-
     def get_by_version(self, version: str) -> Optional[TermsTableModel]:
         """Get terms entry by version."""
         stmt = select(TermsTableModel).filter(TermsTableModel.version == version)
@@ -1,9 +1,11 @@
+import time
 import uuid
-from typing import List
+from typing import List, Optional, Tuple
 
 from fastapi import HTTPException
 from sqlalchemy.orm import Session
 
+from app.core.config import settings
 from app.domains.terms.terms_repository import TermsRepository
 from app.schemas import (
     TermsCreate,
@@ -13,6 +15,15 @@ from app.schemas import (
     TermsUpdate,
 )
 
+# (expires_at, latest terms) — Terms change rarely, so the latest version is memoized per process
+_latest_terms_cache: Optional[Tuple[float, Optional[TermsDetail]]] = None
+
+
+def invalidate_latest_terms_cache() -> None:
+    """Drop the memoized latest Terms so the next read hits the database."""
+    global _latest_terms_cache
+    _latest_terms_cache = None
+
 
 class TermsService:
     """Service layer for Terms business logic."""
@@ -25,6 +36,7 @@ class TermsService:
     def create_terms(self, terms_in: TermsCreate) -> TermsRead:
         try:
             terms = self.repository.create(terms_in.model_dump())
+            invalidate_latest_terms_cache()
             return TermsRead.model_validate(terms)
         except ValueError as e:
             raise HTTPException(status_code=400, detail=str(e))
@@ -48,11 +60,17 @@ class TermsService:
         """
         Returns the newest Terms entry based on creation date.
         Returns None if no Terms exist.
+        Cached for TERMS_CACHE_TTL_SECONDS and invalidated on any Terms write.
         """
+        global _latest_terms_cache
+        now = time.monotonic()
+        if _latest_terms_cache and _latest_terms_cache[0] > now:
+            return _latest_terms_cache[1]
+
         latest = self.repository.get_latest()
-        if not latest:
-            return None
-        return TermsDetail.model_validate(latest)
+        detail = TermsDetail.model_validate(latest) if latest else None
+        _latest_terms_cache = (now + settings.TERMS_CACHE_TTL_SECONDS, detail)
+        return detail
 
     # list
     def list_terms(self, skip: int = 0, limit: int = 50) -> List[TermsList]:
@@ -69,6 +87,7 @@ class TermsService:
 
         try:
             updated = self.repository.update(terms, update_data)
+            invalidate_latest_terms_cache()
             return TermsRead.model_validate(updated)
         except ValueError as e:
             raise HTTPException(status_code=400, detail=str(e))
@@ -80,3 +99,4 @@ class TermsService:
             raise HTTPException(status_code=404, detail="Terms not found.")
 
         self.repository.delete(terms)
+        invalidate_latest_terms_cache()
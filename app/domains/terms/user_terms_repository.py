@@ -1,11 +1,11 @@
 import uuid
 from typing import List, Optional
 
-from sqlalchemy import select
+from sqlalchemy import Row, select
 from sqlalchemy.exc import IntegrityError
-from sqlalchemy.orm import Session, selectinload
+from sqlalchemy.orm import Session
 
-from app.models import UserTermsAcceptanceTableModel
+from app.models import TermsTableModel, UserTermsAcceptanceTableModel
 from app.repositories.base import BaseRepository
 
 
@@ -47,14 +47,18 @@ class UserTermsAcceptanceRepository(BaseRepository[UserTermsAcceptanceTableModel
         )
         return self.db.scalar(stmt)
 
-    def list_by_user(self, user_id: uuid.UUID) -> List[UserTermsAcceptanceTableModel]:
+    def list_by_user(self, user_id: uuid.UUID) -> List[Row]:
+        """
+        List a user's acceptances, newest first, as (id, terms_id, accepted_at, version) rows.
+        The Terms version is joined in, so no ORM objects or relationship loads are involved.
+        """
         stmt = (
-            select(self.model)
+            select(self.model.id, self.model.terms_id, self.model.accepted_at, TermsTableModel.version)
+            .join(TermsTableModel, self.model.terms_id == TermsTableModel.id)
             .filter(self.model.user_id == user_id)
-            .options(selectinload(self.model.terms))
             .order_by(self.model.accepted_at.desc())
         )
-        return list(self.db.scalars(stmt).all())
+        return list(self.db.execute(stmt).all())
 
 
     def get_last_by_user(self, user_id: uuid.UUID) -> Optional[UserTermsAcceptanceTableModel]:
@@ -65,3 +69,28 @@ class UserTermsAcceptanceRepository(BaseRepository[UserTermsAcceptanceTableModel
             .limit(1)
         )
         return self.db.scalar(stmt)
+
+    def get_latest_terms_status(self, user_id: uuid.UUID) -> Optional[Row]:
+        """
+        Fetch the latest Terms and the user's last accepted terms_id in a single round-trip.
+        Returns None if no Terms exist.
+        """
+        latest = (
+            select(TermsTableModel.id, TermsTableModel.version)
+            .order_by(TermsTableModel.created_at.desc())
+            .limit(1)
+            .subquery()
+        )
+        user_last = (
+            select(self.model.terms_id)
+            .filter(self.model.user_id == user_id)
+            .order_by(self.model.accepted_at.desc())
+            .limit(1)
+            .scalar_subquery()
+        )
+        stmt = select(
+            latest.c.id.label("latest_terms_id"),
+            latest.c.version.label("latest_version"),
+            user_last.label("user_last_accepted_terms_id"),
+        )
+        return self.db.execute(stmt).first()
@@ -6,6 +6,7 @@ from sqlalchemy.orm import Session
 
 from app.domains.terms.terms_service import TermsService
 from app.domains.terms.user_terms_repository import UserTermsAcceptanceRepository
+from app.models import UserTermsAcceptanceTableModel
 from app.schemas.user_terms_acceptance import (
     UserTermsAcceptanceCreate,
     UserTermsAcceptanceList,
@@ -28,19 +29,51 @@ class UserTermsAcceptanceService:
 
         existing = self.repository.get_by_user_and_terms(user_id, latest_terms.id)
         if existing:
-            return UserTermsAcceptanceRead.model_validate(existing)
+            return self._to_read(existing, latest_terms.version)
 
         data = UserTermsAcceptanceCreate(user_id=user_id, terms_id=latest_terms.id)
         try:
             created = self.repository.create(data.model_dump())
-            return UserTermsAcceptanceRead.model_validate(created)
+            return self._to_read(created, latest_terms.version)
         except ValueError as e:
             raise HTTPException(status_code=400, detail=str(e))
 
+    @staticmethod
+    def _to_read(acceptance: UserTermsAcceptanceTableModel, version: str) -> UserTermsAcceptanceRead:
+        """Build the read schema with a known version instead of lazy-loading the Terms relation."""
+        return UserTermsAcceptanceRead(
+            id=acceptance.id,
+            user_id=acceptance.user_id,
+            terms_id=acceptance.terms_id,
+            accepted_at=acceptance.accepted_at,
+            version=version,
+        )
+
     def get_last_user_acceptance(self, user_id: uuid.UUID) -> Optional[UserTermsAcceptanceRead]:
         acc = self.repository.get_last_by_user(user_id)
         return UserTermsAcceptanceRead.model_validate(acc) if acc else None
 
+    def get_terms_status(self, user_id: uuid.UUID) -> dict:
+        """Check whether the user accepted the latest Terms version."""
+        row = self.repository.get_latest_terms_status(user_id)
+        if not row:
+            return {
+                "latest_terms_id": None,
+                "latest_version": None,
+                "accepted_latest": False,
+                "user_last_accepted_terms_id": None,
+            }
+
+        return {
+            "latest_terms_id": row.latest_terms_id,
+            "latest_version": row.latest_version,
+            "accepted_latest": row.user_last_accepted_terms_id == row.latest_terms_id,
+            "user_last_accepted_terms_id": row.user_last_accepted_terms_id,
+        }
+
     def list_user_acceptances(self, user_id: uuid.UUID) -> List[UserTermsAcceptanceList]:
-        acc_list = self.repository.list_by_user(user_id)
-        return [UserTermsAcceptanceList.model_validate(a) for a in acc_list]
+        rows = self.repository.list_by_user(user_id)
+        return [
+            UserTermsAcceptanceList(id=row.id, terms_id=row.terms_id, accepted_at=row.accepted_at, version=row.version)
+            for row in rows
+        ]
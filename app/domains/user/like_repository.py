@@ -3,7 +3,7 @@ import uuid
 from typing import List, Optional
 
 from sqlalchemy import select
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, raiseload
 
 from app.literals.like_status import LikeStatus, LikeTargetType
 from app.models import UserLike
@@ -65,24 +65,21 @@ class UserLikeRepository(BaseRepository[UserLike]):
             updated_at=datetime.datetime.now(datetime.UTC),
         )
         self.db.add(like)
-        self.db.commit()
-        self.db.refresh(like)
+        self.db.flush()
         return like
 
     def reactivate_like(self, like: UserLike) -> UserLike:
         """Reactivate an inactive like."""
         like.status = LikeStatus.ACTIVE
         like.updated_at = datetime.datetime.now(datetime.UTC)
-        self.db.commit()
-        self.db.refresh(like)
+        self.db.flush()
         return like
 
     def deactivate_like(self, like: UserLike) -> UserLike:
         """Deactivate an active like."""
         like.status = LikeStatus.INACTIVE
         like.updated_at = datetime.datetime.now(datetime.UTC)
-        self.db.commit()
-        self.db.refresh(like)
+        self.db.flush()
         return like
 
     def get_user_likes(
@@ -93,10 +90,15 @@ class UserLikeRepository(BaseRepository[UserLike]):
     ) -> List[UserLike]:
         """
         Retrieve all likes for a user, optionally filtered by status.
+        Relationships are never needed for listing, so lazy loads raise instead of issuing N+1 queries.
         """
-        stmt = select(UserLike).filter(
-            UserLike.user_id == user_id,
-            UserLike.target_type == target_type,
+        stmt = (
+            select(UserLike)
+            .filter(
+                UserLike.user_id == user_id,
+                UserLike.target_type == target_type,
+            )
+            .options(raiseload("*"))
         )
 
         if only_active:
@@ -5,6 +5,7 @@ from fastapi import HTTPException
 from sqlalchemy.orm import Session
 from starlette import status
 
+from app.core.database import unit_of_work
 from app.domains.user.like_repository import UserLikeRepository
 from app.literals.like_status import LikeStatus, LikeTargetType
 from app.schemas.user_like import UserLikeRead
@@ -30,17 +31,21 @@ class UserLikeService:
         - If no like exists → creates a new one
         - If like is already active → returns existing like
         """
-        existing_like = self.repository.get_like(user_id, target_id, target_type)
-
-        if existing_like:
-            if existing_like.status == LikeStatus.INACTIVE:
-                like = self.repository.reactivate_like(existing_like)
+        with unit_of_work(self.db):
+            existing_like = self.repository.get_like(user_id, target_id, target_type)
+
+            if existing_like:
+                if existing_like.status == LikeStatus.INACTIVE:
+                    like = self.repository.reactivate_like(existing_like)
+                else:
+                    like = existing_like
             else:
-                like = existing_like
-        else:
-            like = self.repository.create_like(user_id, target_id, target_type)
+                like = self.repository.create_like(user_id, target_id, target_type)
+
+            # Serialize before commit so the expired instance is not reloaded
+            like_read = UserLikeRead.model_validate(like)
 
-        return UserLikeRead.model_validate(like)
+        return like_read
 
     def unlike_target(
         self,
@@ -69,7 +74,8 @@ class UserLikeService:
                 detail="You are not allowed to remove this like",
             )
 
-        self.repository.deactivate_like(like)
+        with unit_of_work(self.db):
+            self.repository.deactivate_like(like)
 
     def get_user_likes(
         self,
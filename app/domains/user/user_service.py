@@ -35,10 +35,12 @@ class UserService:
     def create_user(self, user_in: UserCreate) -> UserRead:
         """
         Create a new user.
-        Password is already hashed by the Pydantic validator.
+        The password is hashed here rather than in the schema, so bcrypt never runs
+        on the event loop while FastAPI validates the request body.
         """
         try:
             user_data = user_in.model_dump()
+            user_data["password"] = hash_password(user_in.password)
             user = self.repository.create(user_data)
             return UserRead.model_validate(user)
         except IntegrityError as e:
@@ -1,6 +1,7 @@
 import uuid
 from typing import List
 
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 from app.domains.channel import ChannelRepository
@@ -25,18 +26,26 @@ class WebSocketConnectionService:
         Returns a list of strings like ["channel:{uuid}", "channel:{uuid}"]
         """
 
-        memberships = (
-            self.db.query(ChannelMember)
-            .filter(ChannelMember.user_id == user_id)
-            .filter(ChannelMember.is_banned.is_(False))
-            .all()
+        stmt = select(ChannelMember.channel_id).filter(
+            ChannelMember.user_id == user_id,
+            ChannelMember.is_banned.is_(False),
         )
-
-        channel_ids = [m.channel_id for m in memberships]
+        channel_ids = self.db.scalars(stmt).all()
 
         topics = [f"channel:{cid}" for cid in channel_ids]
         return topics
 
+    async def get_cached_channel_subscriptions(self, user_id: uuid.UUID) -> List[str]:
+        """
+        Same as get_user_channel_subscriptions, served from Valkey when possible.
+        Reconnecting clients skip the membership query until the cache expires or is invalidated.
+        """
+        topics = await ws_service.get_cached_channel_subscriptions(user_id)
+        if topics is None:
+            topics = self.get_user_channel_subscriptions(user_id)
+            await ws_service.cache_channel_subscriptions(user_id, topics)
+        return topics
+
     async def handle_client_message(self, data: dict, user_id: uuid.UUID):
         """
         Process incoming messages sent directly via WebSocket (not HTTP).
@@ -60,7 +69,7 @@ class WebSocketConnectionService:
         try:
             channel_id = uuid.UUID(channel_id_str)
 
-            user = self.db.query(User).filter(User.id == user_id).first()
+            user = self.db.get(User, user_id)
             username = user.username if user else "Unknown"
 
             await ws_service.send_typing_indicator(
@@ -1,10 +1,22 @@
+import asyncio
+import logging
 import uuid
-from typing import Dict, Set
+from typing import Dict, List, Optional, Set, Tuple
 
+import orjson
 from fastapi import WebSocket
 
 from app.domains.websocket.websocket_repository import SocketRepository
 
+logger = logging.getLogger(__name__)
+
+# Events buffered per connection; a consumer that falls this far behind starts losing events
+CONNECTION_QUEUE_SIZE = 1000
+
+# Backoff between attempts to rebuild the shared subscription after a Valkey error
+LISTENER_RETRY_INITIAL_SECONDS = 0.5
+LISTENER_RETRY_MAX_SECONDS = 30.0
+
 
 class WebSocketManager:
     def __init__(self):
@@ -12,14 +24,20 @@ class WebSocketManager:
 
         self.user_connections: Dict[str, Set[str]] = {}
 
+        # Pub/sub fan-out: one Valkey subscription per process, one queue per connection
+        self.topic_queues: Dict[str, Set[asyncio.Queue]] = {}
+        self.connection_queues: Dict[str, Tuple[asyncio.Queue, List[str]]] = {}
+        self._pubsub = None
+        self._listener_task: Optional[asyncio.Task] = None
+
         self.repository = SocketRepository()
 
     async def connect(self, websocket: WebSocket, user_id: uuid.UUID, connection_id: str):
         """
-        Accepts the socket, stores it in memory, and syncs status to Valkey/Redis.
+        Stores the socket in memory, syncs status to Valkey/Redis, then accepts it.
+        Bookkeeping happens before the handshake completes so the connection is fully registered
+        by the time the client can observe it.
         """
-        await websocket.accept()
-
         self.active_connections[connection_id] = websocket
 
         user_id_str = str(user_id)
@@ -30,6 +48,8 @@ class WebSocketManager:
 
         await self.repository.add_user_connection(user_id_str, connection_id)
 
+        await websocket.accept()
+
     async def disconnect(self, user_id: uuid.UUID, connection_id: str):
         """
         Removes socket from memory and Valkey/Redis.
@@ -38,6 +58,8 @@ class WebSocketManager:
         if connection_id in self.active_connections:
             del self.active_connections[connection_id]
 
+        await self.unsubscribe(connection_id)
+
         user_id_str = str(user_id)
         if user_id_str in self.user_connections:
             self.user_connections[user_id_str].discard(connection_id)
@@ -46,6 +68,129 @@ class WebSocketManager:
 
         await self.repository.remove_user_connection(user_id_str, connection_id)
 
+    async def subscribe(self, connection_id: str, topics: List[str]) -> asyncio.Queue:
+        """
+        Register a connection for the given topics and return the queue its events are delivered to.
+        Valkey topics are subscribed only when their first local listener appears.
+        """
+        queue: asyncio.Queue = asyncio.Queue(maxsize=CONNECTION_QUEUE_SIZE)
+        self.connection_queues[connection_id] = (queue, topics)
+
+        new_topics = []
+        for topic in topics:
+            subscribers = self.topic_queues.setdefault(topic, set())
+            if not subscribers:
+                new_topics.append(topic)
+            subscribers.add(queue)
+
+        if self._pubsub is None:
+            self._pubsub = self.repository.pubsub()
+        if new_topics:
+            await self._pubsub.subscribe(*new_topics)
+        if self._listener_task is None or self._listener_task.done():
+            self._listener_task = asyncio.create_task(self._listen())
+
+        return queue
+
+    async def unsubscribe(self, connection_id: str):
+        """
+        Drop a connection's queue and release Valkey topics nobody on this server listens to anymore.
+        """
+        queue, topics = self.connection_queues.pop(connection_id, (None, []))
+
+        stale_topics = []
+        for topic in topics:
+            subscribers = self.topic_queues.get(topic)
+            if subscribers is None:
+                continue
+            subscribers.discard(queue)
+            if not subscribers:
+                del self.topic_queues[topic]
+                stale_topics.append(topic)
+
+        if self._pubsub is None:
+            return
+
+        if not self.topic_queues:
+            pubsub, listener_task = self._pubsub, self._listener_task
+            self._pubsub, self._listener_task = None, None
+
+            if listener_task:
+                listener_task.cancel()
+                try:
+                    await listener_task
+                except asyncio.CancelledError:
+                    pass
+
+            await pubsub.unsubscribe()
+            await pubsub.aclose()
+        elif stale_topics:
+            await self._pubsub.unsubscribe(*stale_topics)
+
+    async def _listen(self):
+        """
+        Background task: keeps the shared subscription alive and fans its events out to local queues.
+        On a Valkey error the subscription is rebuilt for every current topic, with exponential backoff,
+        so one dropped connection does not silence every socket on this server.
+        """
+        loop = asyncio.get_running_loop()
+        delay = LISTENER_RETRY_INITIAL_SECONDS
+        resubscribe = False
+
+        while True:
+            started = loop.time()
+            try:
+                if resubscribe:
+                    await self._resubscribe()
+                await self._forward(self._pubsub)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                if loop.time() - started > LISTENER_RETRY_MAX_SECONDS:
+                    delay = LISTENER_RETRY_INITIAL_SECONDS
+                logger.error(f"Redis listener error, resubscribing in {delay:.1f}s: {e}")
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, LISTENER_RETRY_MAX_SECONDS)
+                resubscribe = True
+
+    async def _resubscribe(self):
+        """
+        Replace the shared subscription with a fresh one covering every topic that still has listeners.
+        """
+        stale, self._pubsub = self._pubsub, self.repository.pubsub()
+        try:
+            await stale.aclose()
+        except Exception:
+            pass
+
+        if self.topic_queues:
+            await self._pubsub.subscribe(*self.topic_queues)
+
+    async def _forward(self, pubsub):
+        """
+        Read the subscription and push each event to the queues of the connections listening on its topic.
+        Publishers always send JSON text, so payloads are forwarded as-is without a parse/re-encode round-trip.
+        """
+        while True:
+            # Subscribe/unsubscribe confirmations are filtered out by redis-py itself
+            message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=1.0)
+            if message is None:
+                continue
+
+            queues = self.topic_queues.get(message["channel"])
+            if not queues:
+                continue
+
+            payload = message["data"]
+            if isinstance(payload, bytes):
+                payload = payload.decode("utf-8")
+
+            for queue in list(queues):
+                try:
+                    queue.put_nowait(payload)
+                except asyncio.QueueFull:
+                    logger.warning(f"Dropping event on {message['channel']} for a connection that is not keeping up")
+
     async def send_to_connection(self, connection_id: str, message: dict):
         """
         Send a message to a specific connection ID (if it exists on this server).
@@ -53,7 +198,7 @@ class WebSocketManager:
         if connection_id in self.active_connections:
             websocket = self.active_connections[connection_id]
             try:
-                await websocket.send_json(message)
+                await websocket.send_text(orjson.dumps(message).decode())
             except RuntimeError:
                 pass
             except Exception as e:
@@ -71,11 +216,13 @@ class WebSocketManager:
     async def broadcast(self, message: dict):
         """
         Send message to ALL connected users on THIS server.
+        The message is serialized once and the same text frame is sent to every connection.
         """
+        payload = orjson.dumps(message).decode()
 
         for websocket in list(self.active_connections.values()):
             try:
-                await websocket.send_json(message)
+                await websocket.send_text(payload)
             except Exception:
                 pass
 
@@ -1,5 +1,8 @@
 from app.core.valkey import valkey_client
 
+# Refreshed on every connect so sets left behind by crashed workers expire
+USER_CONNECTIONS_TTL_SECONDS = 24 * 3600
+
 
 class SocketRepository:
     """
@@ -10,11 +13,22 @@ class SocketRepository:
     def _redis(self):
         return valkey_client.client
 
-    async def add_user_connection(self, user_id: str, connection_id: str):
-        await self._redis.sadd(f"user_connections:{user_id}", connection_id)
+    @staticmethod
+    def _connections_key(user_id: str) -> str:
+        return f"user_connections:{user_id}"
+
+    async def add_user_connection(self, user_id: str, *connection_ids: str):
+        key = self._connections_key(user_id)
+        async with valkey_client.pipeline() as pipe:
+            pipe.sadd(key, *connection_ids)
+            pipe.expire(key, USER_CONNECTIONS_TTL_SECONDS)
+            await pipe.execute()
 
-    async def remove_user_connection(self, user_id: str, connection_id: str):
-        await self._redis.srem(f"user_connections:{user_id}", connection_id)
+    async def remove_user_connection(self, user_id: str, *connection_ids: str):
+        await self._redis.srem(self._connections_key(user_id), *connection_ids)
 
     async def get_user_connections(self, user_id: str) -> set[str]:
-        return await self._redis.smembers(f"user_connections:{user_id}")
+        return await self._redis.smembers(self._connections_key(user_id))
+
+    def pubsub(self):
+        return self._redis.pubsub()
@@ -3,6 +3,7 @@ from datetime import datetime, timezone
 from typing import Any, Optional
 
 from app.core.valkey import valkey_client
+from app.literals.websocket import EventTopic
 
 
 class WebSocketService:
@@ -11,9 +12,11 @@ class WebSocketService:
     Decoupled from the raw database implementation.
     """
 
-    async def _publish(self, channel: str, event_type: str, data: dict[str, Any]):
+    async def _publish(self, channel: str | list[str], event_type: str, data: dict[str, Any], wait: bool = True):
         """
         Internal helper to format the message, serialize UUIDs, and publish to Valkey.
+        A list of channels gets the same message in one pipelined round trip.
+        With wait=False the publish is queued and batched instead of awaited.
         """
 
         clean_data = {}
@@ -25,7 +28,12 @@ class WebSocketService:
 
         message = {"type": event_type, "timestamp": datetime.now(timezone.utc).isoformat(), "data": clean_data}
 
-        await valkey_client.publish(channel, message)
+        if isinstance(channel, list):
+            await valkey_client.publish_many(channel, message)
+        elif wait:
+            await valkey_client.publish(channel, message)
+        else:
+            valkey_client.publish_nowait(channel, message)
 
     async def send_channel_message(
         self,
@@ -116,11 +124,16 @@ class WebSocketService:
         )
 
     async def send_user_kicked(self, channel_id: uuid.UUID, user_id: uuid.UUID):
-        await self._publish(f"user:{user_id}", "user_kicked", {"channel_id": channel_id})
-        await self._publish(f"channel:{channel_id}", "user_kicked", {"channel_id": channel_id, "user_id": user_id})
+        await self._publish(
+            [f"user:{user_id}", f"channel:{channel_id}"],
+            "user_kicked",
+            {"channel_id": channel_id, "user_id": user_id},
+        )
 
     async def send_channel_created(self, channel_id: uuid.UUID, channel_name: str):
-        await self._publish("global", "channel_created", {"channel_id": channel_id, "channel_name": channel_name})
+        await self._publish(
+            EventTopic.CHANNELS.value, "channel_created", {"channel_id": channel_id, "channel_name": channel_name}
+        )
 
     async def send_channel_updated(self, channel_id: uuid.UUID, updated_fields: dict):
         data = {"channel_id": channel_id}
@@ -136,6 +149,7 @@ class WebSocketService:
             f"channel:{channel_id}",
             "user_typing",
             {"channel_id": channel_id, "user_id": user_id, "username": username, "is_typing": is_typing},
+            wait=False,
         )
 
     async def send_message_notification(
@@ -150,5 +164,24 @@ class WebSocketService:
     async def send_general_notification(self, user_id: uuid.UUID, title: str, message: str):
         await self._publish(f"user:{user_id}", "notification", {"title": title, "message": message})
 
+    @staticmethod
+    def _channel_subscriptions_key(user_id: uuid.UUID) -> str:
+        return f"user:{user_id}:channels"
+
+    async def get_cached_channel_subscriptions(self, user_id: uuid.UUID) -> Optional[list[str]]:
+        """
+        Return the cached channel topics for a user, or None if they are not cached.
+        """
+        return await valkey_client.get(self._channel_subscriptions_key(user_id))
+
+    async def cache_channel_subscriptions(self, user_id: uuid.UUID, topics: list[str]):
+        await valkey_client.set(self._channel_subscriptions_key(user_id), topics)
+
+    async def invalidate_channel_subscriptions(self, *user_ids: uuid.UUID):
+        """
+        Drop the cached channel topics for the given users; call whenever their memberships change.
+        """
+        await valkey_client.munset([self._channel_subscriptions_key(user_id) for user_id in user_ids])
+
 
 ws_service = WebSocketService()
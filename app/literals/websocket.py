@@ -0,0 +1,10 @@
+from enum import Enum
+
+
+class EventTopic(str, Enum):
+    """Broadcast pub/sub topics, sharded by event type. Per-user and per-channel topics are built dynamically."""
+
+    CHANNELS = "events:channels"
+
+
+__all__ = ["EventTopic"]
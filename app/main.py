@@ -6,6 +6,7 @@ from fastapi.middleware.cors import CORSMiddleware
 from starlette.middleware.sessions import SessionMiddleware
 
 import app.models
+from app.api.dependencies import preload_oauth_metadata
 from app.api.health import router as health_router
 from app.api.v1.endpoints import (
     admin,
@@ -36,6 +37,7 @@ from app.api.v1.endpoints import (
 )
 from app.core.config import settings
 from app.core.middleware import AutoLoggingMiddleware, EndpointRateLimitMiddleware, global_exception_handler
+from app.core.rate_limiter import load_scripts
 from app.core.valkey import valkey_client
 from app.seeds.seed import seed_database
 
@@ -62,6 +64,8 @@ async def lifespan(app: FastAPI):
 
         seed_database()
         await valkey_client.connect()
+        await load_scripts()
+        await preload_oauth_metadata()
         print("App starting...")
         yield
     finally:
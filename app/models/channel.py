@@ -7,7 +7,7 @@ from typing import TYPE_CHECKING, List
 import sqlalchemy as sa
 from sqlalchemy import func, select
 from sqlalchemy.ext.hybrid import hybrid_property
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.orm import Mapped, mapped_column, query_expression, relationship
 
 from app.core.database import Base
 from app.literals.channels import ChannelCategory, ChannelType
@@ -28,7 +28,7 @@ class Channel(Base):
     id: Mapped[uuid.UUID] = mapped_column(sa.UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     name: Mapped[str] = mapped_column(sa.String(60), nullable=False, index=True)
     description: Mapped[str | None] = mapped_column(sa.String(120))
-    channel_type: Mapped[ChannelType] = mapped_column(sa.String(50), default="public")
+    channel_type: Mapped[ChannelType] = mapped_column(sa.String(50), default="public", index=True)
     category: Mapped[ChannelCategory | None] = mapped_column(
         sa.Enum(ChannelCategory),
         nullable=True,
@@ -56,12 +56,18 @@ class Channel(Base):
 
     messages: Mapped[List[Message]] = relationship("Message", back_populates="channel", cascade="all, delete-orphan")
 
+    loaded_members_count: Mapped[int | None] = query_expression()
+
     @hybrid_property
     def members_count(self):
+        if self.loaded_members_count is not None:
+            return self.loaded_members_count
         return len(self.members)
 
     @members_count.expression
     def members_count(cls):
+        from app.models.channel_member import ChannelMember
+
         return (
             select(func.count(ChannelMember.user_id)).where(ChannelMember.channel_id == cls.id).label("members_count")
         )
@@ -5,7 +5,7 @@ import uuid
 from typing import TYPE_CHECKING
 
 import sqlalchemy as sa
-from sqlalchemy import ForeignKey
+from sqlalchemy import ForeignKey, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.database import Base
@@ -38,6 +38,16 @@ class ChannelBan(Base):
     banned_user: Mapped[User] = relationship("User", foreign_keys=[user_id])
     banner: Mapped[User] = relationship("User", foreign_keys=[banned_by])
 
+    # Ban and unban close the user's active bans in the channel
+    __table_args__ = (
+        Index(
+            "ix_channel_bans_channel_user_active",
+            "channel_id",
+            "user_id",
+            postgresql_where=sa.text("active"),
+        ),
+    )
+
 
 class ChannelUnban(Base):
     """Separate model for unbanned users with information."""
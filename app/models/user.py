@@ -5,7 +5,7 @@ import uuid
 from typing import TYPE_CHECKING, Any, Dict, List
 
 import sqlalchemy as sa
-from sqlalchemy import Column, ForeignKey
+from sqlalchemy import Column, ForeignKey, Index
 from sqlalchemy.orm import Mapped, relationship
 
 from app.core.database import Base
@@ -53,6 +53,21 @@ class User(Base):
     referral_code = Column(sa.String(5), unique=True, nullable=False)
     referred_by_id = Column(sa.UUID, ForeignKey("user.id"), nullable=True)
 
+    # Trigram indexes back the ILIKE '%term%' search in UserRepository.get_all (requires pg_trgm)
+    __table_args__ = (
+        Index("ix_user_username_trgm", "username", postgresql_using="gin", postgresql_ops={"username": "gin_trgm_ops"}),
+        Index("ix_user_email_trgm", "email", postgresql_using="gin", postgresql_ops={"email": "gin_trgm_ops"}),
+        Index(
+            "ix_user_first_name_trgm",
+            "first_name",
+            postgresql_using="gin",
+            postgresql_ops={"first_name": "gin_trgm_ops"},
+        ),
+        Index(
+            "ix_user_last_name_trgm", "last_name", postgresql_using="gin", postgresql_ops={"last_name": "gin_trgm_ops"}
+        ),
+    )
+
     faculty: Mapped[Faculty] = relationship("Faculty", back_populates="users")
 
     # Use string references for relationships
@@ -105,7 +120,7 @@ class User(Base):
     @property
     def is_admin(self) -> bool:
         """Returns True if the user has admin role."""
-        return self.role.lower() == "admin"
+        return self.role == Role.ADMIN
 
 
 def create_payload_from_user(db_user: User) -> Dict[str, Any]:
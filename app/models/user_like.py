@@ -5,7 +5,7 @@ import uuid
 from typing import TYPE_CHECKING
 
 import sqlalchemy as sa
-from sqlalchemy import ForeignKey
+from sqlalchemy import ForeignKey, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core import Base
@@ -39,5 +39,15 @@ class UserLike(Base):
         sa.DateTime, default=datetime.datetime.now(datetime.UTC), onupdate=datetime.datetime.now(datetime.UTC)
     )
 
+    # Like counters filter on the target; the PK only covers lookups that start from user_id
+    __table_args__ = (
+        Index(
+            "ix_user_like_target_active",
+            "target_id",
+            "target_type",
+            postgresql_where=sa.text("status = 'ACTIVE'"),
+        ),
+    )
+
     # ORM relationships
     user: Mapped["User"] = relationship(back_populates="likes")
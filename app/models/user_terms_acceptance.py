@@ -5,7 +5,7 @@ import uuid
 from typing import TYPE_CHECKING
 
 import sqlalchemy as sa
-from sqlalchemy import ForeignKey
+from sqlalchemy import ForeignKey, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core import Base
@@ -31,6 +31,8 @@ class UserTermsAcceptanceTableModel(Base):
         sa.DateTime, default=lambda: datetime.datetime.now(datetime.UTC), nullable=False
     )
 
+    __table_args__ = (Index("ix_user_terms_acceptance_user_accepted_at", "user_id", "accepted_at"),)
+
     user: Mapped["User"] = relationship(back_populates="accepted_terms")
     terms: Mapped["TermsTableModel"] = relationship()
 
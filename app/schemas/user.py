@@ -6,7 +6,6 @@ from typing import TYPE_CHECKING, List, Literal, Optional
 
 from pydantic import BaseModel, ConfigDict, EmailStr, Field, field_validator
 
-from app.core.security import hash_password
 from app.literals.users import Role
 from app.schemas.university import FacultyRead
 
@@ -46,12 +45,6 @@ class UserCreate(UserBase):
     provider: Provider = Field(default="local")
     role: Role = Field(default=Role.BASIC)
 
-    @field_validator("password")
-    @classmethod
-    def hash_password(cls, value: str) -> str:
-        """Hash password."""
-        return hash_password(value)
-
     model_config = ConfigDict(from_attributes=True)
 
 
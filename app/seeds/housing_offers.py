@@ -3,12 +3,14 @@ import os
 import uuid
 from typing import List
 
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 
 from app.domains.file.file_association_repository import FileAssociationRepository
-from app.domains.file.file_repository import FileRepository
 from app.domains.housing import HousingAmenityRepository, HousingCategoryRepository, HousingOfferRepository
-from app.models import HousingCategoryTableModel, HousingOfferTableModel, User
+from app.models import File, HousingCategoryTableModel, HousingOfferTableModel, User
+
+PHOTO_CONTENT_TYPES = {".jpg": "image/jpeg", ".jpeg": "image/jpeg", ".png": "image/png"}
 
 
 def seed_housing_data(db: Session, users: List[User]) -> List[HousingOfferTableModel]:
@@ -23,7 +25,6 @@ def seed_housing_data(db: Session, users: List[User]) -> List[HousingOfferTableM
     category_repo = HousingCategoryRepository(db)
     amenity_repo = HousingAmenityRepository(db)
     offer_repo = HousingOfferRepository(db)
-    file_repo = FileRepository(db)
     file_assoc_repo = FileAssociationRepository(db)
 
     categories = category_repo.get_all()
@@ -453,7 +454,7 @@ def seed_housing_data(db: Session, users: List[User]) -> List[HousingOfferTableM
             "posted_date": datetime.datetime.now(datetime.UTC),
         }
 
-        photo_ids = _process_offer_photos(db, i, user.id, file_repo)
+        photo_ids = _process_offer_photos(db, i, user.id)
 
         offer = offer_repo.create(
             offer_data,
@@ -489,9 +490,7 @@ def seed_housing_data(db: Session, users: List[User]) -> List[HousingOfferTableM
     return created_offers
 
 
-def _process_offer_photos(
-    db: Session, offer_index: int, uploader_id: uuid.UUID, file_repo: FileRepository
-) -> List[uuid.UUID]:
+def _process_offer_photos(db: Session, offer_index: int, uploader_id: uuid.UUID) -> List[uuid.UUID]:
     """Process photos for an offer and return list of file IDs."""
 
     TOTAL_AVAILABLE_FOLDERS = 6
@@ -504,31 +503,36 @@ def _process_offer_photos(
         print(f"! Warning: {photo_dir} not found (Calculated from index {offer_index}). Skipping.")
         return []
 
-    photo_files = [f for f in os.listdir(photo_dir) if f.lower().endswith((".jpg", ".jpeg", ".png"))]
-    file_ids = []
+    with os.scandir(photo_dir) as entries:
+        photo_files = [
+            entry
+            for entry in entries
+            if entry.is_file() and os.path.splitext(entry.name)[1].lower() in PHOTO_CONTENT_TYPES
+        ]
 
-    for file_name in photo_files:
-        file_path = os.path.join(photo_dir, file_name)
+    rows = []
+    for entry in photo_files:
         try:
-            with open(file_path, "rb") as f:
+            with open(entry.path, "rb") as f:
                 file_content = f.read()
+        except OSError as e:
+            print(f"! Error reading file {entry.path}: {e}")
+            continue
 
-            content_type = "image/jpeg" if file_name.lower().endswith((".jpg", ".jpeg")) else "image/png"
-
-            file_data = {
-                "filename": file_name,
-                "content_type": content_type,
+        rows.append(
+            {
+                "id": uuid.uuid4(),
+                "filename": entry.name,
+                "content_type": PHOTO_CONTENT_TYPES[os.path.splitext(entry.name)[1].lower()],
                 "file_data": file_content,
                 "file_size": len(file_content),
                 "uploader_id": uploader_id,
                 "is_public": True,
                 "storage_type": "database",
             }
+        )
 
-            file_record = file_repo.create(file_data)
-            file_ids.append(file_record.id)
-        except Exception as e:
-            print(f"! Error reading file {file_path}: {e}")
-            continue
+    if rows:
+        db.execute(insert(File), rows)
 
-    return file_ids
+    return [row["id"] for row in rows]
@@ -1,3 +1,6 @@
+import uuid
+
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 
 from app.models import Interest, InterestCategory
@@ -162,14 +165,24 @@ INTEREST_CATALOG = {
 
 def seed_interests(db: Session) -> None:
     """Create the default catalog of interest categories and interests."""
-    for category_name, interests in INTEREST_CATALOG.items():
-        category = db.query(InterestCategory).filter_by(name=category_name).first()
-        if not category:
-            category = InterestCategory(name=category_name)
-            db.add(category)
-            db.flush()
+    category_ids = dict(
+        db.query(InterestCategory.name, InterestCategory.id).filter(InterestCategory.name.in_(INTEREST_CATALOG)).all()
+    )
+    new_categories = [
+        {"id": uuid.uuid4(), "name": category_name}
+        for category_name in INTEREST_CATALOG
+        if category_name not in category_ids
+    ]
+    if new_categories:
+        db.execute(insert(InterestCategory), new_categories)
+        category_ids.update((category["name"], category["id"]) for category in new_categories)
 
-        existing = {interest.name for interest in category.interests}
-        for interest_name in interests:
-            if interest_name not in existing:
-                db.add(Interest(name=interest_name, category=category))
+    existing = {name for (name,) in db.query(Interest.name).all()}
+    new_interests = [
+        {"id": uuid.uuid4(), "name": interest_name, "category_id": category_ids[category_name]}
+        for category_name, interests in INTEREST_CATALOG.items()
+        for interest_name in interests
+        if interest_name not in existing
+    ]
+    if new_interests:
+        db.execute(insert(Interest), new_interests)
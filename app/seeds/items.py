@@ -121,6 +121,7 @@ def seed_items(db: Session, users: List[User]) -> List[ItemTableModel]:
 
     items = []
     admin_user = users[0]
+    now = datetime.datetime.now(datetime.UTC)
 
     for item_data in items_data:
         image_folder_name = item_data.pop("image_folder")
@@ -132,8 +133,8 @@ def seed_items(db: Session, users: List[User]) -> List[ItemTableModel]:
             seller_id=seller.id,
             category_id=category.id,
             status=ItemStatus.ACTIVE,
-            posted_date=datetime.datetime.now(datetime.UTC),
-            updated_at=datetime.datetime.now(datetime.UTC),
+            posted_date=now,
+            updated_at=now,
             **item_data,
         )
 
@@ -169,7 +170,7 @@ def seed_items(db: Session, users: List[User]) -> List[ItemTableModel]:
                     filename=image_path.name,
                     content_type=content_type,
                     file_size=len(image_data),
-                    uploaded_at=datetime.datetime.now(datetime.UTC),
+                    uploaded_at=now,
                     is_public=True,
                     storage_type="database",
                     file_data=image_data,
@@ -185,7 +186,7 @@ def seed_items(db: Session, users: List[User]) -> List[ItemTableModel]:
                     entity_type="item",
                     entity_id=item.id,
                     order=order,
-                    created_at=datetime.datetime.now(datetime.UTC),
+                    created_at=now,
                 )
 
                 db.add(file_association)
@@ -3,6 +3,7 @@
 from sqlalchemy.orm import Session
 
 from app.core import Base, engine
+from app.core.config import settings
 from app.seeds import seed_housing_data
 from app.seeds.amenities import seed_amenities
 from app.seeds.category import seed_housing_categories
@@ -25,7 +26,9 @@ def seed_database(nuke: bool = False):
     if nuke:
         Base.metadata.drop_all(bind=engine)
 
-    Base.metadata.create_all(bind=engine)
+    # Outside dev, Alembic owns the schema and has already run; only rebuild it after a nuke
+    if nuke or settings.ENVIRONMENT == "dev":
+        Base.metadata.create_all(bind=engine)
 
     db = Session(engine)
 
@@ -47,12 +47,13 @@ def seed_users(db: Session) -> List[User]:
         return faculties_map.get(name)
 
     hashed_password = hash_password(settings.DEFAULT_PASSWORD)
+    now = datetime.datetime.now(datetime.UTC)
 
     def make_user(**kwargs) -> User:
         return User(
             id=uuid.uuid4(),
             password=hashed_password,
-            created_at=datetime.datetime.now(datetime.UTC),
+            created_at=now,
             **kwargs,
         )
 
@@ -0,0 +1,41 @@
+"""channel type and active ban indexes
+
+Revision ID: 4d2a9c6e1f37
+Revises: b055d8ccdf6b
+Create Date: 2026-10-16 19:12:07.226841
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "4d2a9c6e1f37"
+down_revision: Union[str, Sequence[str], None] = "b055d8ccdf6b"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.batch_alter_table("channel", schema=None) as batch_op:
+        batch_op.create_index(batch_op.f("ix_channel_channel_type"), ["channel_type"], unique=False)
+
+    with op.batch_alter_table("channel_bans", schema=None) as batch_op:
+        batch_op.create_index(
+            "ix_channel_bans_channel_user_active",
+            ["channel_id", "user_id"],
+            unique=False,
+            postgresql_where=sa.text("active"),
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table("channel_bans", schema=None) as batch_op:
+        batch_op.drop_index("ix_channel_bans_channel_user_active")
+
+    with op.batch_alter_table("channel", schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f("ix_channel_channel_type"))
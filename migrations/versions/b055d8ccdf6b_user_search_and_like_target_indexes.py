@@ -0,0 +1,54 @@
+"""user search and like target indexes
+
+Revision ID: b055d8ccdf6b
+Revises: c7e1eed33c57
+Create Date: 2026-10-16 18:05:41.503317
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b055d8ccdf6b"
+down_revision: Union[str, Sequence[str], None] = "c7e1eed33c57"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+USER_SEARCH_COLUMNS = ("username", "email", "first_name", "last_name")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    if op.get_bind().dialect.name == "postgresql":
+        op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    with op.batch_alter_table("user", schema=None) as batch_op:
+        for column in USER_SEARCH_COLUMNS:
+            batch_op.create_index(
+                f"ix_user_{column}_trgm",
+                [column],
+                unique=False,
+                postgresql_using="gin",
+                postgresql_ops={column: "gin_trgm_ops"},
+            )
+
+    with op.batch_alter_table("user_like", schema=None) as batch_op:
+        batch_op.create_index(
+            "ix_user_like_target_active",
+            ["target_id", "target_type"],
+            unique=False,
+            postgresql_where=sa.text("status = 'ACTIVE'"),
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table("user_like", schema=None) as batch_op:
+        batch_op.drop_index("ix_user_like_target_active")
+
+    with op.batch_alter_table("user", schema=None) as batch_op:
+        for column in reversed(USER_SEARCH_COLUMNS):
+            batch_op.drop_index(f"ix_user_{column}_trgm")
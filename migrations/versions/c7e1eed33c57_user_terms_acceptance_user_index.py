@@ -0,0 +1,29 @@
+"""user_terms_acceptance user index
+
+Revision ID: c7e1eed33c57
+Revises: 091e9af0855b
+Create Date: 2026-10-16 17:40:12.118204
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c7e1eed33c57"
+down_revision: Union[str, Sequence[str], None] = "091e9af0855b"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.batch_alter_table("user_terms_acceptance", schema=None) as batch_op:
+        batch_op.create_index("ix_user_terms_acceptance_user_accepted_at", ["user_id", "accepted_at"], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table("user_terms_acceptance", schema=None) as batch_op:
+        batch_op.drop_index("ix_user_terms_acceptance_user_accepted_at")
@@ -13,6 +13,7 @@ from sqlalchemy.orm import Session
 from app.core import Base, get_db
 from app.core.config import settings
 from app.core.valkey import valkey_client
+from app.domains.terms.terms_service import invalidate_latest_terms_cache
 from app.models import User
 from app.schemas import LoginRequest
 from app.seeds import seed_channels, seed_housing_data, seed_interests, seed_reports, seed_users
@@ -377,6 +378,19 @@ async def setup_valkey():
     await valkey_client.disconnect()
 
 
+@pytest.fixture(scope="function", autouse=True)
+def reset_latest_terms_cache():
+    """
+    Drop the per-process latest Terms cache around each test.
+    The cached entry would otherwise survive the per-test rollback.
+    """
+    invalidate_latest_terms_cache()
+
+    yield
+
+    invalidate_latest_terms_cache()
+
+
 @pytest.fixture
 def get_token(client):
     def _get_token(username):
@@ -422,12 +436,19 @@ def configure_test_settings():
     settings.TESTING = False
 
 
+@pytest.fixture(scope="session")
+def default_password_hash():
+    """Hash DEFAULT_PASSWORD once for users created directly in fixtures."""
+    from app.core.security import hash_password
+
+    return hash_password(settings.DEFAULT_PASSWORD)
+
+
 @pytest.fixture
-def recruiter_token(client, db):
+def recruiter_token(client, db, default_password_hash):
     """Create user Recruiter global and return her token."""
     import uuid
 
-    from app.core.security import hash_password
     from app.literals.users import Role
     from app.models import User
 
@@ -438,7 +459,7 @@ def recruiter_token(client, db):
     user = User(
         username=unique_username,
         email=f"{unique_username}@example.com",
-        password=hash_password(settings.DEFAULT_PASSWORD),
+        password=default_password_hash,
         first_name="Recruiter",
         last_name="Global",
         role=Role.RECRUITER,
@@ -1,6 +1,16 @@
 import uuid
 
+import bcrypt
+
 from app.core.config import settings
+from app.core.security import (
+    create_access_token,
+    decode_token,
+    forget_token,
+    hash_password,
+    password_needs_rehash,
+    verify_password,
+)
 from app.literals.users import Role
 from app.models import ConnectionTableModel, User, UserTermsAcceptanceTableModel
 
@@ -214,3 +224,67 @@ class TestAuthEndpoints:
         payload = {"email": "just@email.com"}
         response = client.post("/auth/signup", json=payload)
         assert response.status_code == 422
+
+
+class TestPasswordHashing:
+    """Test argon2id hashing with the bcrypt fallback for older hashes."""
+
+    def test_verify_argon2_hash(self):
+        hashed = hash_password("correct horse")
+        assert hashed.startswith("$argon2id")
+        assert verify_password("correct horse", hashed)
+        assert not verify_password("wrong horse", hashed)
+        assert not password_needs_rehash(hashed)
+
+    def test_verify_legacy_bcrypt_hash(self):
+        hashed = bcrypt.hashpw(b"correct horse", bcrypt.gensalt(rounds=4)).decode("ascii")
+        assert verify_password("correct horse", hashed)
+        assert not verify_password("wrong horse", hashed)
+        assert password_needs_rehash(hashed)
+
+    def test_login_upgrades_bcrypt_hash(self, client, db):
+        username = f"bcrypt_user_{uuid.uuid4().hex[:8]}"
+        legacy_hash = bcrypt.hashpw(settings.DEFAULT_PASSWORD.encode(), bcrypt.gensalt(rounds=4)).decode("ascii")
+        user = User(
+            username=username,
+            email=f"{username}@example.com",
+            password=legacy_hash,
+            first_name="Legacy",
+            last_name="Hash",
+            role=Role.BASIC,
+            provider="local",
+            is_verified=True,
+            referral_code=uuid.uuid4().hex[:5].upper(),
+        )
+        db.add(user)
+        db.commit()
+
+        response = client.post("/auth/login", data={"username": username, "password": settings.DEFAULT_PASSWORD})
+        assert response.status_code == 200
+
+        db.refresh(user)
+        assert user.password.startswith("$argon2id")
+        assert verify_password(settings.DEFAULT_PASSWORD, user.password)
+
+        response = client.post("/auth/login", data={"username": username, "password": settings.DEFAULT_PASSWORD})
+        assert response.status_code == 200
+
+
+class TestDecodeTokenCache:
+    """Test the in-process cache of verified token payloads."""
+
+    def test_cached_payload_is_not_shared(self):
+        token = create_access_token({"sub": str(uuid.uuid4()), "role": Role.BASIC})
+        first = decode_token(token)
+        first["role"] = Role.ADMIN
+        first["injected"] = True
+
+        second = decode_token(token)
+        third = decode_token(token)
+        assert second["role"] == Role.BASIC
+        assert "injected" not in second
+        assert second is not third
+
+        second["role"] = Role.ADMIN
+        assert decode_token(token)["role"] == Role.BASIC
+        forget_token(token)
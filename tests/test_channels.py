@@ -1,3 +1,6 @@
+import datetime
+import uuid
+
 import pytest
 
 from app.literals.channels import ChannelCategory, ChannelRole
@@ -495,3 +498,64 @@ class TestJoinLeave:
             headers={"Authorization": f"Bearer {user_token}"},
         )
         assert response.status_code == 404
+
+
+class TestChannelRepositoryLookups:
+    """Tests the channel-existence fallbacks in the member lookups."""
+
+    def test_get_members_distinguishes_missing_and_empty_channel(self, channel_repository, admin_user_id):
+        """An unknown channel yields None, an empty one yields an empty list."""
+        assert channel_repository.get_members(uuid.uuid4()) is None
+
+        channel = channel_repository.create({"name": "Empty Channel"})
+        assert channel_repository.get_members(channel.id) == []
+
+    def test_ban_non_member_requires_existing_channel(self, channel_repository, admin_user_id):
+        """Banning someone who is not a member still checks that the channel exists."""
+        user_id = uuid.UUID(admin_user_id)
+        duration = datetime.timedelta(days=1)
+        assert channel_repository.ban_member(uuid.uuid4(), user_id, "spam", duration) is None
+
+        channel = channel_repository.create({"name": "Ban Channel"})
+        ban = channel_repository.ban_member(channel.id, user_id, "spam", duration)
+        assert ban is not None and ban.active
+
+    def test_reban_and_unban_close_active_bans(self, channel_repository, db, basic_user_id):
+        """A new ban or an unban deactivates the previous ban and updates the membership flag."""
+        user_id = uuid.UUID(basic_user_id)
+        duration = datetime.timedelta(days=1)
+        channel = channel_repository.create({"name": "Reban Channel"})
+        channel_repository.add_member(channel.id, user_id)
+
+        first = channel_repository.ban_member(channel.id, user_id, "spam", duration)
+        second = channel_repository.ban_member(channel.id, user_id, "spam again", duration)
+        db.refresh(first)
+        assert not first.active and second.active
+        assert channel_repository.get_member(channel.id, user_id).is_banned
+
+        assert channel_repository.unban_member(channel.id, user_id, "appeal") is not None
+        db.refresh(second)
+        assert not second.active
+        assert not channel_repository.get_member(channel.id, user_id).is_banned
+
+    def test_get_all_loads_members_count_in_query(self, channel_repository, db, basic_user_id):
+        """Listing channels fills members_count from the SELECT instead of loading the members."""
+        channel_id = channel_repository.create({"name": "Counted Channel"}).id
+        channel_repository.add_member(channel_id, uuid.UUID(basic_user_id))
+        db.expunge_all()
+
+        listed = next(ch for ch in channel_repository.get_all(limit=1000) if ch.id == channel_id)
+        assert listed.loaded_members_count == 1
+        assert listed.members_count == 1
+
+    def test_add_member_twice_returns_existing_membership(self, channel_repository, basic_user_id):
+        """Re-adding a member leaves the original row untouched instead of failing on the primary key."""
+        user_id = uuid.UUID(basic_user_id)
+        channel = channel_repository.create({"name": "Upsert Channel"})
+
+        first = channel_repository.add_member(channel.id, user_id, ChannelRole.MODERATOR)
+        second = channel_repository.add_member(channel.id, user_id, ChannelRole.USER)
+
+        assert second is first
+        assert second.role == ChannelRole.MODERATOR
+        assert len(channel_repository.get_members(channel.id)) == 1
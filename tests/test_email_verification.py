@@ -1,4 +1,9 @@
+import asyncio
+
+import aiosmtplib
+
 from app.core.config import settings
+from app.core.email_service import EmailService
 
 
 class TestEmailVerification:
@@ -203,3 +208,79 @@ class TestPasswordChange:
             headers={"Authorization": f"Bearer {admin_token}"},
         )
         assert response.status_code == 422
+
+
+class FakeSMTP:
+    """Stand-in for aiosmtplib.SMTP that records connects, sends and overlapping sends."""
+
+    def __init__(self):
+        self.is_connected = False
+        self.connects = 0
+        self.sent = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.disconnect_next = False
+
+    async def connect(self):
+        self.is_connected = True
+        self.connects += 1
+
+    def close(self):
+        self.is_connected = False
+
+    async def send_message(self, msg):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0.01)
+            if self.disconnect_next:
+                self.disconnect_next = False
+                self.is_connected = False
+                raise aiosmtplib.SMTPServerDisconnected("Connection lost")
+            self.sent.append(msg["To"])
+        finally:
+            self.in_flight -= 1
+
+
+class TestSharedSMTPConnection:
+    """Test the shared SMTP connection used by EmailService."""
+
+    def _service(self, monkeypatch, smtp):
+        monkeypatch.setattr(aiosmtplib, "SMTP", lambda **kwargs: smtp)
+        service = EmailService()
+        service._smtp_configured = True
+        return service
+
+    async def test_reconnects_once_when_server_disconnected(self, monkeypatch):
+        smtp = FakeSMTP()
+        service = self._service(monkeypatch, smtp)
+
+        assert await service._send_email("first@example.com", "Hi", "<p>Hi</p>")
+        smtp.disconnect_next = True
+        assert await service._send_email("second@example.com", "Hi", "<p>Hi</p>")
+
+        assert smtp.sent == ["first@example.com", "second@example.com"]
+        assert smtp.connects == 2
+
+    async def test_gives_up_after_one_retry(self, monkeypatch):
+        smtp = FakeSMTP()
+        service = self._service(monkeypatch, smtp)
+
+        async def always_disconnected(msg):
+            raise aiosmtplib.SMTPServerDisconnected("Connection lost")
+
+        smtp.send_message = always_disconnected
+        assert not await service._send_email("lost@example.com", "Hi", "<p>Hi</p>")
+        assert smtp.connects == 2
+
+    async def test_lock_serializes_concurrent_sends(self, monkeypatch):
+        smtp = FakeSMTP()
+        service = self._service(monkeypatch, smtp)
+        recipients = [f"user{index}@example.com" for index in range(5)]
+
+        results = await asyncio.gather(*(service._send_email(to, "Hi", "<p>Hi</p>") for to in recipients))
+
+        assert all(results)
+        assert sorted(smtp.sent) == recipients
+        assert smtp.max_in_flight == 1
+        assert smtp.connects == 1
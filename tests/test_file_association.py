@@ -59,6 +59,8 @@ class TestFileAssociations:
         assert resp.status_code == 201
         data = resp.json()
         assert len(data) == 3
+        assert [assoc["file_id"] for assoc in data] == file_ids
+        assert [assoc["order"] for assoc in data] == [0, 1, 2]
 
     def test_get_associations_by_entity(self, client, auth_headers, db):
         """Test retrieving all associations for an entity."""
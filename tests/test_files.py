@@ -3,6 +3,7 @@ import uuid
 
 import pytest
 import starlette.status
+from sqlalchemy.exc import NoResultFound
 
 from app.core.config import settings
 
@@ -206,7 +207,9 @@ class TestFileDelete:
 
         assert response.status_code == starlette.status.HTTP_204_NO_CONTENT
 
-        file_repository.get_by_id(uuid.UUID(file_id))
+        assert file_repository.get_by_id(uuid.UUID(file_id)) is None
+        with pytest.raises(NoResultFound):
+            file_repository.soft_delete(uuid.UUID(file_id))
 
     def test_delete_file_as_admin(self, client, admin_token, create_test_file, db):
         """Test admin can delete any file."""
@@ -233,6 +236,25 @@ class TestFileDelete:
         assert response.status_code == starlette.status.HTTP_404_NOT_FOUND
 
 
+class TestFileVisibility:
+    """Tests for file visibility endpoint."""
+
+    def test_update_visibility_success(self, client, user_token, create_test_file):
+        """Test owner can make a file public."""
+        file_id = create_test_file()
+
+        response = client.patch(
+            f"/files/{file_id}/visibility",
+            json={"is_public": True},
+            headers={"Authorization": f"Bearer {user_token}"},
+        )
+
+        assert response.status_code == starlette.status.HTTP_200_OK
+        data = response.json()
+        assert data["is_public"] is True
+        assert data["public_url"].endswith(f"/files/public/{file_id}")
+
+
 class TestListFiles:
     """Tests for listing files endpoint."""
 
@@ -0,0 +1,99 @@
+import uuid
+
+import httpx
+from fastapi import FastAPI
+
+from app.core.middleware import AutoLoggingMiddleware, EndpointRateLimitMiddleware
+from app.core.rate_limiter import CooldownManager, RateLimiter, RateLimitStrategy
+
+
+async def test_sliding_window_blocks_after_limit():
+    """The sliding window allows max_requests calls, then reports a retry delay."""
+    key = f"test:{uuid.uuid4()}"
+
+    results = [
+        await RateLimiter.check_rate_limit(
+            key, max_requests=3, window_seconds=60, strategy=RateLimitStrategy.SLIDING_WINDOW
+        )
+        for _ in range(4)
+    ]
+
+    assert [allowed for allowed, _, _ in results] == [True, True, True, False]
+    assert [remaining for _, remaining, _ in results[:3]] == [2, 1, 0]
+    assert 0 < results[3][2] <= 60
+
+    info = await RateLimiter.get_rate_limit_info(key, RateLimitStrategy.SLIDING_WINDOW)
+    assert info["current_count"] == 3
+
+    await RateLimiter.reset_rate_limit(key)
+    info = await RateLimiter.get_rate_limit_info(key, RateLimitStrategy.SLIDING_WINDOW)
+    assert info["current_count"] == 0
+
+
+async def test_token_bucket_allows_burst_up_to_capacity():
+    """The token bucket admits a burst of capacity requests, then asks the caller to wait."""
+    key = f"test:{uuid.uuid4()}"
+
+    results = [
+        await RateLimiter.check_rate_limit(
+            key, max_requests=3, window_seconds=1, strategy=RateLimitStrategy.TOKEN_BUCKET
+        )
+        for _ in range(4)
+    ]
+
+    assert [allowed for allowed, _, _ in results] == [True, True, True, False]
+    assert [remaining for _, remaining, _ in results[:3]] == [2, 1, 0]
+    assert results[3][2] >= 1
+
+
+async def test_cooldown_blocks_until_reset():
+    """A cooldown blocks repeated actions until it expires or is reset."""
+    user_id = uuid.uuid4()
+
+    assert await CooldownManager.check_cooldown(user_id, "test_action", 30) == (True, 0)
+
+    can_perform, remaining = await CooldownManager.check_cooldown(user_id, "test_action", 30)
+    assert can_perform is False
+    assert 0 < remaining <= 30
+
+    await CooldownManager.reset_cooldown(user_id, "test_action")
+    assert await CooldownManager.check_cooldown(user_id, "test_action", 30) == (True, 0)
+
+
+async def test_endpoint_rate_limit_middleware():
+    """Matching paths get rate-limit headers and a 429 past the limit; other paths pass through."""
+    app = FastAPI()
+    app.add_middleware(EndpointRateLimitMiddleware, endpoint_limits={"/limited": (2, 60)})
+    app.add_middleware(AutoLoggingMiddleware)
+
+    @app.get("/limited")
+    async def limited():
+        return {"ok": True}
+
+    @app.get("/open")
+    async def open_route():
+        return {"ok": True}
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        responses = [await client.get("/limited") for _ in range(3)]
+        open_response = await client.get("/open")
+
+    assert [r.status_code for r in responses] == [200, 200, 429]
+    assert [r.headers["X-RateLimit-Remaining"] for r in responses] == ["1", "0", "0"]
+    assert all("X-Request-ID" in r.headers for r in responses)
+    assert open_response.status_code == 200
+    assert "X-RateLimit-Limit" not in open_response.headers
+
+
+async def test_sliding_window_trims_to_lowered_limit():
+    """Lowering the limit for a key trims the stored window instead of letting it grow."""
+    key = f"test:{uuid.uuid4()}"
+
+    for _ in range(5):
+        await RateLimiter.check_rate_limit(key, max_requests=5, window_seconds=60)
+    is_allowed, remaining, _ = await RateLimiter.check_rate_limit(key, max_requests=2, window_seconds=60)
+
+    assert (is_allowed, remaining) == (False, 0)
+    info = await RateLimiter.get_rate_limit_info(key, RateLimitStrategy.SLIDING_WINDOW)
+    assert info["current_count"] == 2
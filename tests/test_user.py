@@ -50,6 +50,35 @@ class TestUsersAPI:
         data = resp.json()
         assert {"id", "email", "username"}.issubset(data.keys())
 
+    def test_me_supports_etag_revalidation(self, client, user_token):
+        resp = client.get("/users/me", headers=_auth(user_token))
+        assert resp.status_code == 200
+        etag = resp.headers["ETag"]
+        assert etag.startswith('W/"')
+
+        cached = client.get("/users/me", headers={**_auth(user_token), "If-None-Match": etag})
+        assert cached.status_code == 304
+        assert cached.content == b""
+
+        client.patch("/users/me", json={"first_name": "Changed"}, headers=_auth(user_token))
+        fresh = client.get("/users/me", headers={**_auth(user_token), "If-None-Match": etag})
+        assert fresh.status_code == 200
+        assert fresh.headers["ETag"] != etag
+
+    def test_me_etag_matches_list_and_wildcard(self, client, user_token):
+        etag = client.get("/users/me", headers=_auth(user_token)).headers["ETag"]
+        strong = etag.removeprefix("W/")
+
+        listed = client.get("/users/me", headers={**_auth(user_token), "If-None-Match": f'"other", {strong}'})
+        assert listed.status_code == 304
+
+        wildcard = client.get("/users/me", headers={**_auth(user_token), "If-None-Match": "*"})
+        assert wildcard.status_code == 304
+
+        # A value that merely contains our tag as a substring must not match
+        partial = client.get("/users/me", headers={**_auth(user_token), "If-None-Match": f"x{etag}"})
+        assert partial.status_code == 200
+
     def test_me_requires_authentication(self, client):
         resp = client.get("/users/me")
         assert resp.status_code == 401
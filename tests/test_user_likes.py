@@ -1,4 +1,10 @@
+import uuid
+
+from sqlalchemy import event
+
 from app.core.security import get_payload
+from app.domains.user.like_repository import UserLikeRepository
+from app.literals.like_status import LikeTargetType
 from app.models import HousingCategoryTableModel
 from tests.factories.offer_factory import sample_offer_payload
 
@@ -48,3 +54,27 @@ class TestUserLikesEndpoints:
         status_after = client.get(f"/user-likes/{offer_id}/status", headers=auth_headers)
         assert status_after.status_code == 200
         assert status_after.json()["liked"] is False
+
+    def test_my_likes_issues_single_query(self, client, db, auth_headers, user_token):
+        """Listing likes must not lazy-load anything per like (no N+1)."""
+        user_id = uuid.UUID(get_payload(user_token)["sub"])
+        repository = UserLikeRepository(db)
+        for _ in range(5):
+            repository.create_like(user_id, uuid.uuid4(), LikeTargetType.HOUSING_OFFER)
+        db.expire_all()
+
+        statements = []
+
+        def count_selects(conn, cursor, statement, parameters, context, executemany):
+            if statement.lstrip().upper().startswith("SELECT") and "user_like" in statement:
+                statements.append(statement)
+
+        event.listen(db.get_bind(), "before_cursor_execute", count_selects)
+        try:
+            resp = client.get("/user-likes/me", headers=auth_headers)
+        finally:
+            event.remove(db.get_bind(), "before_cursor_execute", count_selects)
+
+        assert resp.status_code == 200
+        assert len(resp.json()) >= 5
+        assert len(statements) == 1
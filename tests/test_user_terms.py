@@ -1,3 +1,6 @@
+from app.domains.terms.terms_service import TermsService
+
+
 def create_term(client, admin_headers, version: str) -> str:
     """Helper to create a term and return its ID."""
     payload = {"version": version, "content": f"Content for {version}"}
@@ -120,3 +123,16 @@ class TestUserTermsEndpoints:
         versions = [item["version"] for item in data]
         assert "v1-LIST" in versions
         assert "v2-LIST" in versions
+
+    def test_latest_terms_cache_invalidated_on_delete(self, client, db, admin_auth_headers):
+        """Deleting the latest terms must not leave a stale cached version behind."""
+        previous_id = create_term(client, admin_auth_headers, "v1-CACHE")
+        latest_id = create_term(client, admin_auth_headers, "v2-CACHE")
+
+        service = TermsService(db)
+        assert str(service.get_latest_terms().id) == latest_id
+
+        resp = client.delete(f"/terms/{latest_id}", headers=admin_auth_headers)
+        assert resp.status_code == 204
+
+        assert str(service.get_latest_terms().id) == previous_id
@@ -0,0 +1,37 @@
+import uuid
+
+from app.core import valkey
+from app.core.valkey import valkey_client
+
+
+async def test_disconnect_flushes_queued_publishes():
+    """Messages queued with publish_nowait are still delivered when the client disconnects."""
+    channel = f"test:{uuid.uuid4()}"
+    pubsub = valkey_client.client.pubsub()
+    await pubsub.subscribe(channel)
+    await pubsub.get_message(timeout=1)
+
+    for index in range(5):
+        valkey_client.publish_nowait(channel, {"n": index})
+    await valkey_client.disconnect()
+
+    received = []
+    while len(received) < 5:
+        message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=1)
+        assert message is not None
+        received.append(message["data"])
+    assert received == [f'{{"n":{index}}}' for index in range(5)]
+    await pubsub.aclose()
+
+
+async def test_publish_nowait_drops_when_queue_full(monkeypatch):
+    """A full publish queue drops new messages instead of growing without bound."""
+    monkeypatch.setattr(valkey, "PUBLISH_QUEUE_SIZE", 2)
+    channel = f"test:{uuid.uuid4()}"
+
+    for index in range(5):
+        valkey_client.publish_nowait(channel, {"n": index})
+    assert valkey_client._publish_queue.qsize() == 2
+
+    await valkey_client.disconnect()
+    assert valkey_client._publish_task is None
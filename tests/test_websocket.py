@@ -1,9 +1,12 @@
+import asyncio
 import uuid
 
 import pytest
 from starlette.websockets import WebSocketDisconnect
 
+from app.core.valkey import valkey_client
 from app.domains.auth.auth_service import verify_token
+from app.domains.websocket import websocket_manager
 from app.domains.websocket.websocket_manager import ws_manager
 from app.domains.websocket.websocket_service import ws_service
 from app.models import ChannelMember
@@ -120,6 +123,30 @@ async def test_websocket_typing_indicator(client, user_token, db):
         assert response["data"]["is_typing"] is True
 
 
+async def test_websocket_client_messages_handled_in_order(client, user_token, db):
+    """
+    Test that consecutive client messages are handled one at a time, in the order they were sent.
+    """
+
+    payload = await verify_token(user_token)
+    user_id = uuid.UUID(payload.get("sub"))
+
+    member_record = db.query(ChannelMember).filter(ChannelMember.user_id == user_id).first()
+    if not member_record:
+        pytest.fail("Test user is not a member of any seeded channel.")
+
+    channel_id = str(member_record.channel_id)
+
+    with client.websocket_connect(f"/ws?token={user_token}") as websocket:
+        states = [True, False, True, False]
+        for is_typing in states:
+            websocket.send_json({"type": "typing", "channel_id": channel_id, "is_typing": is_typing})
+
+        received = [websocket.receive_json()["data"]["is_typing"] for _ in states]
+
+        assert received == states
+
+
 async def test_websocket_disconnect_cleanup(client, user_token):
     """
     Test that disconnecting cleans up the WebSocketManager state.
@@ -132,3 +159,189 @@ async def test_websocket_disconnect_cleanup(client, user_token):
         assert user_id_str in ws_manager.user_connections
 
     assert user_id_str not in ws_manager.user_connections
+
+
+async def test_websocket_shared_subscription_fanout(client, user_token):
+    """
+    Test that connections share one Valkey subscription and each receives the event.
+    """
+
+    payload = await verify_token(user_token)
+    user_id = uuid.UUID(payload.get("sub"))
+    topic = f"user:{user_id}"
+
+    with client.websocket_connect(f"/ws?token={user_token}") as first:
+        with client.websocket_connect(f"/ws?token={user_token}") as second:
+            assert len(ws_manager.topic_queues[topic]) == 2
+
+            await ws_service.send_general_notification(user_id=user_id, title="Fanout", message="Both")
+
+            assert first.receive_json()["data"]["title"] == "Fanout"
+            assert second.receive_json()["data"]["title"] == "Fanout"
+
+    assert topic not in ws_manager.topic_queues
+    assert ws_manager._listener_task is None
+
+
+async def test_websocket_channel_subscriptions_cache_invalidated_on_leave(client, user_token, db):
+    """
+    Test that connecting caches the user's channel topics and leaving a channel drops the cache.
+    """
+
+    payload = await verify_token(user_token)
+    user_id = uuid.UUID(payload.get("sub"))
+
+    member_record = db.query(ChannelMember).filter(ChannelMember.user_id == user_id).first()
+    if not member_record:
+        pytest.fail("Test user is not a member of any seeded channel.")
+
+    channel_id = member_record.channel_id
+
+    with client.websocket_connect(f"/ws?token={user_token}"):
+        pass
+
+    cached = await ws_service.get_cached_channel_subscriptions(user_id)
+    assert f"channel:{channel_id}" in cached
+
+    response = client.post(f"/channels/{channel_id}/leave", headers={"Authorization": f"Bearer {user_token}"})
+    assert response.status_code in (200, 204)
+
+    assert await ws_service.get_cached_channel_subscriptions(user_id) is None
+
+
+async def test_websocket_channel_subscriptions_cache_invalidated_on_delete(client, user_token, admin_token, db):
+    """
+    Test that deleting a channel drops the cached channel topics of its members.
+    """
+
+    payload = await verify_token(user_token)
+    user_id = uuid.UUID(payload.get("sub"))
+
+    member_record = db.query(ChannelMember).filter(ChannelMember.user_id == user_id).first()
+    if not member_record:
+        pytest.fail("Test user is not a member of any seeded channel.")
+
+    channel_id = member_record.channel_id
+
+    with client.websocket_connect(f"/ws?token={user_token}"):
+        pass
+
+    assert await ws_service.get_cached_channel_subscriptions(user_id) is not None
+
+    response = client.delete(f"/channels/{channel_id}", headers={"Authorization": f"Bearer {admin_token}"})
+    assert response.status_code in (200, 204)
+
+    assert await ws_service.get_cached_channel_subscriptions(user_id) is None
+
+
+async def test_websocket_receives_channel_created_broadcast(client, user_token):
+    """
+    Test that channel lifecycle broadcasts reach every connection through the event-type topic.
+    """
+
+    with client.websocket_connect(f"/ws?token={user_token}") as websocket:
+        channel_id = uuid.uuid4()
+        await ws_service.send_channel_created(channel_id=channel_id, channel_name="new-channel")
+
+        data = websocket.receive_json()
+
+        assert data["type"] == "channel_created"
+        assert data["data"]["channel_id"] == str(channel_id)
+
+
+async def test_websocket_receives_user_kicked_on_user_topic(client, user_token):
+    """
+    Test that a kick published to both the user and channel topics reaches the kicked user.
+    """
+
+    payload = await verify_token(user_token)
+    user_id = uuid.UUID(payload.get("sub"))
+
+    with client.websocket_connect(f"/ws?token={user_token}") as websocket:
+        channel_id = uuid.uuid4()
+        await ws_service.send_user_kicked(channel_id=channel_id, user_id=user_id)
+
+        data = websocket.receive_json()
+
+        assert data["type"] == "user_kicked"
+        assert data["data"] == {"channel_id": str(channel_id), "user_id": str(user_id)}
+
+
+async def test_websocket_batched_frames(client, user_token):
+    """
+    Test that a client connecting with batch=true receives events as JSON arrays.
+    """
+
+    payload = await verify_token(user_token)
+    user_id = uuid.UUID(payload.get("sub"))
+
+    with client.websocket_connect(f"/ws?token={user_token}&batch=true") as websocket:
+        for i in range(3):
+            await ws_service.send_general_notification(user_id=user_id, title=f"T{i}", message="batched")
+
+        received = []
+        while len(received) < 3:
+            frame = websocket.receive_json()
+            assert isinstance(frame, list)
+            received.extend(frame)
+
+        assert [event["data"]["title"] for event in received] == ["T0", "T1", "T2"]
+
+
+async def test_websocket_manager_resubscribes_after_listener_error(monkeypatch):
+    """
+    Test that a Valkey error in the shared listener rebuilds the subscription instead of ending fan-out.
+    """
+
+    monkeypatch.setattr(websocket_manager, "LISTENER_RETRY_INITIAL_SECONDS", 0.01)
+    manager = websocket_manager.WebSocketManager()
+    queue = await manager.subscribe("conn", ["topic:resilience"])
+    broken_pubsub = manager._pubsub
+
+    async def fail(*args, **kwargs):
+        raise ConnectionError("connection dropped")
+
+    monkeypatch.setattr(broken_pubsub, "get_message", fail)
+
+    for _ in range(100):
+        if manager._pubsub is not broken_pubsub:
+            break
+        await asyncio.sleep(0.01)
+    assert manager._pubsub is not broken_pubsub
+    assert not manager._listener_task.done()
+
+    # The rebuilt subscription may need a moment to be registered before publishes reach it
+    for _ in range(100):
+        await valkey_client.publish("topic:resilience", '{"type": "ping"}')
+        try:
+            assert await asyncio.wait_for(queue.get(), 0.05) == '{"type": "ping"}'
+            break
+        except asyncio.TimeoutError:
+            continue
+    else:
+        pytest.fail("No event delivered after the listener recovered.")
+
+    await manager.unsubscribe("conn")
+    assert manager._listener_task is None
+
+
+async def test_websocket_manager_drops_events_for_full_queue(monkeypatch):
+    """
+    Test that one connection with a full queue does not stop delivery to the others.
+    """
+
+    monkeypatch.setattr(websocket_manager, "CONNECTION_QUEUE_SIZE", 1)
+    manager = websocket_manager.WebSocketManager()
+    slow = await manager.subscribe("slow", ["topic:fanout"])
+    fast = await manager.subscribe("fast", ["topic:fanout"])
+
+    for index in range(3):
+        await valkey_client.publish("topic:fanout", f'{{"n": {index}}}')
+        assert await asyncio.wait_for(fast.get(), 1) == f'{{"n": {index}}}'
+
+    assert slow.qsize() == 1
+    assert slow.get_nowait() == '{"n": 0}'
+    assert not manager._listener_task.done()
+
+    await manager.unsubscribe("slow")
+    await manager.unsubscribe("fast")